@@ -27,6 +27,7 @@ from ._function import dump_tabledata
 from ._logger import set_log_level, set_logger
 from ._table_format import FormatAttr, TableFormat
 from .error import (
+    BulkIndexError,
     EmptyHeaderError,
     EmptyTableDataError,
     EmptyTableNameError,
@@ -8,8 +8,51 @@ from __future__ import absolute_import, unicode_literals
 
 import re
 
+import six
+
 
 def strip_quote(text, value):
     re_replace = re.compile("[\"']{:s}[\"']".format(value), re.MULTILINE)
 
     return re_replace.sub(value, text)
+
+
+_RE_QUOTED_BOOL = re.compile("[\"'](true|false)[\"']")
+
+
+def strip_bool_quote(text):
+    return _RE_QUOTED_BOOL.sub(r"\1", text)
+
+
+_escape_char_map = {
+    '"': '\\"',
+    "\\": "\\\\",
+    "\b": "\\b",
+    "\t": "\\t",
+    "\n": "\\n",
+    "\f": "\\f",
+    "\r": "\\r",
+}
+
+
+def to_quoted_str(value, control_char_template="\\u{:04X}"):
+    """
+    Convert a value to a double-quoted string literal.
+    Double quotes, backslashes and control characters are escaped:
+    control characters that have no short escape sequence are written with
+    ``control_char_template`` (e.g. ``"\\x{:02x}"`` for Python).
+    """
+
+    item_list = []
+
+    for char in six.text_type(value):
+        escaped = _escape_char_map.get(char)
+
+        if escaped is not None:
+            item_list.append(escaped)
+        elif ord(char) < 0x20 or ord(char) == 0x7F:
+            item_list.append(control_char_template.format(ord(char)))
+        else:
+            item_list.append(char)
+
+    return '"{}"'.format("".join(item_list))
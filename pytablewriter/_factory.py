@@ -7,6 +7,7 @@
 from __future__ import absolute_import, unicode_literals
 
 import os
+import threading
 
 import typepy
 
@@ -14,9 +15,97 @@ from ._table_format import FormatAttr, TableFormat
 from .error import WriterNotFoundError
 
 
+class _WriterRegistry(object):
+    """
+    Index of format names/file extensions to table writer classes.
+    Lookup tables are built once and replaced as a whole when a writer is
+    registered, so lookups never see a partially updated index.
+    """
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__name_table = {}
+        self.__ext_table = {}
+        self.__name_list = ()
+        self.__ext_list = ()
+
+        name_table = {}
+        ext_table = {}
+        name_set = set()
+        ext_set = set()
+
+        for table_format in TableFormat:
+            name_set.update(table_format.name_list)
+            ext_set.update(table_format.file_extension_list)
+
+            if not table_format.format_attribute & FormatAttr.SECONDARY_NAME:
+                for format_name in table_format.name_list:
+                    name_table.setdefault(format_name, table_format.writer_class)
+
+            if not table_format.format_attribute & FormatAttr.SECONDARY_EXT:
+                for file_extension in table_format.file_extension_list:
+                    ext_table.setdefault(file_extension, table_format.writer_class)
+
+        self.__update(name_table, ext_table, name_set, ext_set)
+
+    @property
+    def name_list(self):
+        return self.__name_list
+
+    @property
+    def extension_list(self):
+        return self.__ext_list
+
+    def find_by_name(self, format_name):
+        return self.__name_table.get(format_name)
+
+    def find_by_extension(self, file_extension):
+        return self.__ext_table.get(file_extension)
+
+    def register(self, writer_class, format_name_list, file_extension_list):
+        with self.__lock:
+            for format_name in format_name_list:
+                if format_name in self.__name_list:
+                    raise ValueError("format name already registered: {}".format(format_name))
+
+            for file_extension in file_extension_list:
+                if file_extension in self.__ext_list:
+                    raise ValueError("file extension already registered: {}".format(file_extension))
+
+            name_table = dict(self.__name_table)
+            ext_table = dict(self.__ext_table)
+            name_table.update((format_name, writer_class) for format_name in format_name_list)
+            ext_table.update(
+                (file_extension, writer_class) for file_extension in file_extension_list
+            )
+
+            self.__update(
+                name_table,
+                ext_table,
+                set(self.__name_list).union(format_name_list),
+                set(self.__ext_list).union(file_extension_list),
+            )
+
+    def __update(self, name_table, ext_table, name_set, ext_set):
+        self.__name_list = tuple(sorted(name_set))
+        self.__ext_list = tuple(sorted(ext_set))
+        self.__ext_table = ext_table
+        self.__name_table = name_table
+
+
+_writer_registry = _WriterRegistry()
+
+
+def _normalize_file_extension(file_extension):
+    return file_extension.lstrip(".").lower()
+
+
 class TableWriterFactory(object):
     """
     A factor class of table writer classes.
+    Format names and file extensions are looked up from an index that built
+    when the module imported, and writers of third-party formats can be added
+    to the index with :py:meth:`.register_writer`.
     """
 
     @classmethod
@@ -65,16 +154,11 @@ class TableWriterFactory(object):
         else:
             file_extension = ext
 
-        file_extension = file_extension.lstrip(".").lower()
-
-        for table_format in TableFormat:
-            if file_extension not in table_format.file_extension_list:
-                continue
-
-            if table_format.format_attribute & FormatAttr.SECONDARY_EXT:
-                continue
+        file_extension = _normalize_file_extension(file_extension)
 
-            return table_format.writer_class()
+        writer_class = _writer_registry.find_by_extension(file_extension)
+        if writer_class is not None:
+            return writer_class()
 
         raise WriterNotFoundError(
             "\n".join(
@@ -131,11 +215,9 @@ class TableWriterFactory(object):
 
         format_name = format_name.lower()
 
-        for table_format in TableFormat:
-            if format_name in table_format.name_list and not (
-                table_format.format_attribute & FormatAttr.SECONDARY_NAME
-            ):
-                return table_format.writer_class()
+        writer_class = _writer_registry.find_by_name(format_name)
+        if writer_class is not None:
+            return writer_class()
 
         raise WriterNotFoundError(
             "\n".join(
@@ -198,12 +280,7 @@ class TableWriterFactory(object):
 
         """
 
-        format_name_set = set()
-        for table_format in TableFormat:
-            for format_name in table_format.name_list:
-                format_name_set.add(format_name)
-
-        return sorted(list(format_name_set))
+        return list(_writer_registry.name_list)
 
     @classmethod
     def get_extension_list(cls):
@@ -239,9 +316,60 @@ class TableWriterFactory(object):
                 xlsx
         """
 
-        file_extension_set = set()
-        for table_format in TableFormat:
-            for file_extension in table_format.file_extension_list:
-                file_extension_set.add(file_extension)
+        return list(_writer_registry.extension_list)
+
+    @classmethod
+    def register_writer(cls, writer_class, format_names=None, file_extensions=None):
+        """
+        Register a table writer class of a third-party format.
+        Registered writers can be created by :py:meth:`.create_from_format_name`
+        and :py:meth:`.create_from_file_extension` in the same way as
+        built-in writers.
+
+        :param writer_class:
+            Table writer class to register.
+            The class is called without arguments to create a writer instance.
+        :param list format_names:
+            Format names of the writer (case insensitive).
+            Defaults to the ``FORMAT_NAME`` attribute of the ``writer_class``.
+        :param list file_extensions:
+            File extensions of the writer (case insensitive).
+            Defaults to no extensions.
+        :raises TypeError: If the ``writer_class`` is not callable.
+        :raises ValueError:
+            If no format names/file extensions are given, any of them are empty,
+            or any of them already registered.
+
+        :Example:
+            .. code:: python
+
+                >>> import pytablewriter as ptw
+                >>> class MyTableWriter(ptw.CsvTableWriter):
+                ...     FORMAT_NAME = "my_format"
+                ...
+                >>> ptw.TableWriterFactory.register_writer(MyTableWriter, file_extensions=["myf"])
+                >>> ptw.TableWriterFactory.create_from_file_extension("output.myf")
+                <...MyTableWriter object at ...>
+        """
 
-        return sorted(list(file_extension_set))
+        if not callable(writer_class):
+            raise TypeError("writer_class must be callable: actual={}".format(writer_class))
+
+        if format_names is None:
+            format_name = getattr(writer_class, "FORMAT_NAME", None)
+            format_names = [format_name] if format_name else []
+
+        format_name_list = [format_name.lower() for format_name in format_names]
+        file_extension_list = [
+            _normalize_file_extension(file_extension) for file_extension in file_extensions or []
+        ]
+
+        if not format_name_list and not file_extension_list:
+            raise ValueError("require at least one format name or file extension")
+
+        if not all(format_name_list) or not all(file_extension_list):
+            raise ValueError("format names and file extensions must not be empty")
+
+        _writer_registry.register(
+            writer_class, sorted(set(format_name_list)), sorted(set(file_extension_list))
+        )
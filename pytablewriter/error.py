@@ -43,3 +43,32 @@ class WriterNotFoundError(Exception):
     """
     Exception raised when appropriate loader writer found.
     """
+
+
+class BulkIndexError(Exception):
+    """
+    Exception raised when documents failed to index to Elasticsearch
+    (after retries) by bulk API requests.
+
+    .. py:attribute:: success_count
+
+        Number of the documents that successfully indexed.
+
+    .. py:attribute:: failed_count
+
+        Number of the documents that failed to index.
+
+    .. py:attribute:: error_list
+
+        Errors of a few of the documents that failed to index
+        (not all of the failed documents are kept).
+        Each error is a |dict| that has ``status``, ``error`` and ``body``
+        (serialized document) keys.
+    """
+
+    def __init__(self, message, success_count=0, error_list=None, failed_count=None):
+        super(BulkIndexError, self).__init__(message)
+
+        self.success_count = success_count
+        self.error_list = error_list or []
+        self.failed_count = len(self.error_list) if failed_count is None else failed_count
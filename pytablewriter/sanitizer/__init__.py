@@ -6,7 +6,8 @@
 
 from __future__ import absolute_import
 
-from ._elasticsearch import ElasticsearchIndexNameSanitizer
+from ._elasticsearch import ElasticsearchIndexNameSanitizer, sanitize_es_index_name
 from ._excel import sanitize_excel_sheet_name, validate_excel_sheet_name
+from ._header import sanitize_headers
 from ._javascript import JavaScriptVarNameSanitizer, sanitize_js_var_name, validate_js_var_name
 from ._python import PythonVarNameSanitizer, sanitize_python_var_name, validate_python_var_name
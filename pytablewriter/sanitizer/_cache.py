@@ -0,0 +1,58 @@
+# encoding: utf-8
+
+from __future__ import absolute_import, unicode_literals
+
+import collections
+import functools
+import threading
+
+
+def lru_cache(maxsize=1024):
+    """
+    A thread-safe memoize decorator that keeps at most ``maxsize`` results
+    of the least recently used arguments.
+    Exceptions are not cached, and calls with unhashable arguments are not memoized.
+    The cache of a decorated function can be cleared by ``cache_clear()``.
+    """
+
+    def decorator(func):
+        cache = collections.OrderedDict()
+        lock = threading.Lock()
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            # types are a part of the key: e.g. "a" == b"a" in Python 2
+            key = tuple((type(arg), arg) for arg in args) + tuple(
+                (name, type(value), value) for name, value in sorted(kwargs.items())
+            )
+
+            try:
+                with lock:
+                    result = cache.pop(key)
+                    cache[key] = result
+
+                return result
+            except KeyError:
+                pass
+            except TypeError:
+                # unhashable arguments
+                return func(*args, **kwargs)
+
+            result = func(*args, **kwargs)
+
+            with lock:
+                cache[key] = result
+                while len(cache) > maxsize:
+                    cache.popitem(last=False)
+
+            return result
+
+        def cache_clear():
+            with lock:
+                cache.clear()
+
+        wrapper.cache_clear = cache_clear
+
+        return wrapper
+
+    return decorator
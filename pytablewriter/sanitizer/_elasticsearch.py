@@ -9,6 +9,7 @@ from __future__ import absolute_import, unicode_literals
 import re
 
 from ._base import VarNameSanitizer
+from ._cache import lru_cache
 
 
 class ElasticsearchIndexNameSanitizer(VarNameSanitizer):
@@ -20,6 +21,10 @@ class ElasticsearchIndexNameSanitizer(VarNameSanitizer):
     def reserved_keywords(self):
         return []
 
+    @property
+    def _reserved_keyword_set(self):
+        return frozenset()
+
     @property
     def _invalid_var_name_head_re(self):
         return self.__RE_INVALID_INDEX_NAME_HEAD
@@ -27,3 +32,21 @@ class ElasticsearchIndexNameSanitizer(VarNameSanitizer):
     @property
     def _invalid_var_name_re(self):
         return self.__RE_INVALID_INDEX_NAME
+
+
+@lru_cache()
+def sanitize_es_index_name(index_name, replacement_text=""):
+    """
+    Make a valid Elasticsearch index name from ``index_name``.
+
+    :param str index_name: Name to sanitize.
+    :param str replacement_text: Replacement text.
+    :return: A replacement string.
+    :rtype: str
+    :raises pathvalidate.NullNameError: If the ``index_name`` is empty.
+
+    .. seealso::
+        :py:class:`.ElasticsearchIndexNameSanitizer`
+    """
+
+    return ElasticsearchIndexNameSanitizer(index_name).sanitize(replacement_text)
@@ -11,6 +11,7 @@ import re
 from pathvalidate import InvalidCharError, InvalidLengthError, validate_null_string
 
 from ._base import _preprocess
+from ._cache import lru_cache
 
 
 __MAX_SHEET_NAME_LEN = 31
@@ -50,6 +51,7 @@ def validate_excel_sheet_name(sheet_name):
         )
 
 
+@lru_cache()
 def sanitize_excel_sheet_name(sheet_name, replacement_text=""):
     """
     Replace invalid characters for an Excel sheet name within
@@ -0,0 +1,110 @@
+# encoding: utf-8
+
+from __future__ import absolute_import, unicode_literals
+
+import re
+
+import six
+import typepy
+from dataproperty import is_multibyte_str
+from pathvalidate import sanitize_ltsv_label
+from tabledata import convert_idx_to_alphabet
+
+from ._cache import lru_cache
+from ._javascript import sanitize_js_var_name
+from ._python import sanitize_python_var_name
+
+
+_RE_INVALID_SQLITE_ATTR_CHARS = re.compile("[{:s}\n\r]".format(re.escape("'\",")))
+
+
+def _sanitize_sqlite_attr_name(header):
+    if is_multibyte_str(header):
+        return header
+
+    return _RE_INVALID_SQLITE_ATTR_CHARS.sub("_", header)
+
+
+_target_to_sanitizer = {
+    # dots are valid in field names of Elasticsearch (object fields)
+    "elasticsearch": six.text_type,
+    "javascript": lambda header: sanitize_js_var_name(header, "_"),
+    "ltsv": sanitize_ltsv_label,
+    "python": lambda header: sanitize_python_var_name(header, "_"),
+    "sqlite": _sanitize_sqlite_attr_name,
+}
+
+# names of these targets are compared case-insensitively to detect collisions
+_case_insensitive_targets = ("sqlite",)
+
+
+def sanitize_headers(headers, target):
+    """
+    Make valid and unique names for the ``target`` from a list of headers.
+
+    Each header is sanitized for the ``target``, and empty names are replaced
+    with column names (``A``, ``B``, ...).
+    Headers for ``"elasticsearch"`` are not modified except for empty and
+    duplicate names (dots in the names are kept as object fields).
+    When the sanitized names collide, the names of the second and subsequent
+    columns are suffixed with ``_2``, ``_3``, ... in the order of the columns.
+    Results are cached for each header list, so sanitizing the same headers
+    again (e.g. for each chunk or table) is cheap.
+
+    :param list headers: Headers to sanitize.
+    :param str target:
+        Target format of the names:
+        ``"elasticsearch"``, ``"javascript"``, ``"ltsv"``, ``"python"`` or ``"sqlite"``.
+    :return: Sanitized names for each header.
+    :rtype: list
+    :raises ValueError: If the ``target`` is unknown.
+    """
+
+    if target not in _target_to_sanitizer:
+        raise ValueError(
+            "unknown target: expected={}, actual={}".format(sorted(_target_to_sanitizer), target)
+        )
+
+    if headers is None:
+        return []
+
+    return list(_sanitize_headers(tuple(headers), target))
+
+
+@lru_cache(maxsize=256)
+def _sanitize_headers(headers, target):
+    sanitize = _target_to_sanitizer[target]
+
+    if target in _case_insensitive_targets:
+        to_key = six.text_type.lower
+    else:
+        to_key = six.text_type
+
+    name_list = []
+    for col_idx, header in enumerate(headers):
+        name = ""
+        if not typepy.is_null_string(header):
+            name = sanitize(six.text_type(header))
+
+        if not name:
+            name = convert_idx_to_alphabet(col_idx)
+
+        name_list.append(name)
+
+    used_key_set = set(to_key(name) for name in name_list)
+    seen_key_set = set()
+    unique_name_list = []
+
+    for name in name_list:
+        if to_key(name) in seen_key_set:
+            suffix_num = 2
+            while to_key("{:s}_{:d}".format(name, suffix_num)) in used_key_set:
+                suffix_num += 1
+
+            name = "{:s}_{:d}".format(name, suffix_num)
+            used_key_set.add(to_key(name))
+
+        seen_key_set.add(to_key(name))
+        unique_name_list.append(name)
+
+    return tuple(unique_name_list)
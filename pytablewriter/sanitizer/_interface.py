@@ -35,8 +35,12 @@ class NameSanitizer(object):
 
         self._value = value.strip()
 
+    @property
+    def _reserved_keyword_set(self):
+        return frozenset(self.reserved_keywords)
+
     def _is_reserved_keyword(self, value):
-        return value in self.reserved_keywords
+        return value in self._reserved_keyword_set
 
     @staticmethod
     def _validate_null_string(text):
@@ -9,6 +9,7 @@ from __future__ import absolute_import, unicode_literals
 import re
 
 from ._base import VarNameSanitizer
+from ._cache import lru_cache
 
 
 class JavaScriptVarNameSanitizer(VarNameSanitizer):
@@ -77,6 +78,10 @@ class JavaScriptVarNameSanitizer(VarNameSanitizer):
     ]
     __JS_BUILTIN_CONSTANTS = ["null", "true", "false"]
 
+    __RESERVED_KEYWORD_SET = frozenset(
+        __JS_RESERVED_KEYWORDS_ES6 + __JS_RESERVED_KEYWORDS_FUTURE + __JS_BUILTIN_CONSTANTS
+    )
+
     __RE_INVALID_VAR_NAME = re.compile("[^a-zA-Z0-9_$]")
     __RE_INVALID_VAR_NAME_HEAD = re.compile("^[^a-zA-Z$]+")
 
@@ -88,6 +93,10 @@ class JavaScriptVarNameSanitizer(VarNameSanitizer):
             + self.__JS_BUILTIN_CONSTANTS
         )
 
+    @property
+    def _reserved_keyword_set(self):
+        return self.__RESERVED_KEYWORD_SET
+
     @property
     def _invalid_var_name_head_re(self):
         return self.__RE_INVALID_VAR_NAME_HEAD
@@ -116,6 +125,7 @@ def validate_js_var_name(var_name):
     JavaScriptVarNameSanitizer(var_name).validate()
 
 
+@lru_cache()
 def sanitize_js_var_name(var_name, replacement_text=""):
     """
     Make a valid JavaScript variable name from ``var_name``.
@@ -9,6 +9,7 @@ from __future__ import absolute_import, unicode_literals
 import re
 
 from ._base import VarNameSanitizer
+from ._cache import lru_cache
 
 
 class PythonVarNameSanitizer(VarNameSanitizer):
@@ -54,6 +55,8 @@ class PythonVarNameSanitizer(VarNameSanitizer):
         "__debug__",
     ]
 
+    __RESERVED_KEYWORD_SET = frozenset(__PYTHON_RESERVED_KEYWORDS + __PYTHON_BUILTIN_CONSTANTS)
+
     __RE_INVALID_VAR_NAME = re.compile("[^a-zA-Z0-9_]")
     __RE_INVALID_VAR_NAME_HEAD = re.compile("^[^a-zA-Z]+")
 
@@ -61,6 +64,10 @@ class PythonVarNameSanitizer(VarNameSanitizer):
     def reserved_keywords(self):
         return self.__PYTHON_RESERVED_KEYWORDS + self.__PYTHON_BUILTIN_CONSTANTS
 
+    @property
+    def _reserved_keyword_set(self):
+        return self.__RESERVED_KEYWORD_SET
+
     @property
     def _invalid_var_name_head_re(self):
         return self.__RE_INVALID_VAR_NAME_HEAD
@@ -92,6 +99,7 @@ def validate_python_var_name(var_name):
     PythonVarNameSanitizer(var_name).validate()
 
 
+@lru_cache()
 def sanitize_python_var_name(var_name, replacement_text=""):
     """
     Make a valid Python variable name from ``var_name``.
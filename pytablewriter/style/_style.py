@@ -23,6 +23,9 @@ _s_to_ts = {"": ThousandSeparator.NONE, ",": ThousandSeparator.COMMA, " ": Thous
 class Style(object):
     """Style specifier class for table elements.
 
+    |Style| instances are immutable and hashable:
+    identical styles share the same instance.
+
     Args:
         align (str / pytablewriter.Align):
             Text alignment specification for cells in a column.
@@ -76,6 +79,16 @@ class Style(object):
         :ref:`example-style`
     """
 
+    __slots__ = (
+        "__align",
+        "__font_size",
+        "__font_style",
+        "__font_weight",
+        "__thousand_separator",
+        "__hash",
+    )
+    __instance_table = {}
+
     @property
     def align(self):
         return self.__align
@@ -96,27 +109,51 @@ class Style(object):
     def thousand_separator(self):
         return self.__thousand_separator
 
-    def __init__(self, **kwargs):
-        self.__align = normalize_enum(kwargs.pop("align", Align.AUTO), Align)
-        self.__validate_attr("align", Align)
-
-        self.__font_size = normalize_enum(kwargs.pop("font_size", FontSize.NONE), FontSize)
-        self.__validate_attr("font_size", FontSize)
-
-        self.__font_style = normalize_enum(kwargs.pop("font_style", FontStyle.NORMAL), FontStyle)
-        self.__validate_attr("font_style", FontStyle)
-
-        self.__font_weight = normalize_enum(
-            kwargs.pop("font_weight", FontWeight.NORMAL), FontWeight
-        )
-        self.__validate_attr("font_weight", FontWeight)
-
-        self.__thousand_separator = self.__normalie_thousand_separator(
-            normalize_enum(
-                kwargs.pop("thousand_separator", ThousandSeparator.NONE), ThousandSeparator
-            )
+    def __new__(cls, **kwargs):
+        key = cls.__to_key(**kwargs)
+
+        # Style instances are immutable: identical styles share an instance
+        try:
+            return cls.__instance_table[(cls, key)]
+        except KeyError:
+            pass
+
+        self = super(Style, cls).__new__(cls)
+        for attr_name, value in zip(
+            ("align", "font_size", "font_style", "font_weight", "thousand_separator"), key
+        ):
+            object.__setattr__(self, "_Style__{:s}".format(attr_name), value)
+        object.__setattr__(self, "_Style__hash", hash(key))
+
+        return cls.__instance_table.setdefault((cls, key), self)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Style instances are immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("Style instances are immutable")
+
+    def __hash__(self):
+        return self.__hash
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return (
+            _make_style,
+            (
+                self.__class__,
+                self.align,
+                self.font_size,
+                self.font_style,
+                self.font_weight,
+                self.thousand_separator,
+            ),
         )
-        self.__validate_attr("thousand_separator", ThousandSeparator)
 
     def __repr__(self):
         items = []
@@ -135,6 +172,9 @@ class Style(object):
         return "({})".format(", ".join(items))
 
     def __eq__(self, other):
+        if self is other:
+            return True
+
         if self.__class__ is not other.__class__:
             return NotImplemented
 
@@ -152,8 +192,31 @@ class Style(object):
         equal = self.__eq__(other)
         return NotImplemented if equal is NotImplemented else not equal
 
-    def __validate_attr(self, attr_name, expected_type):
-        value = getattr(self, attr_name)
+    @classmethod
+    def __to_key(cls, **kwargs):
+        align = normalize_enum(kwargs.pop("align", Align.AUTO), Align)
+        cls.__validate_attr("align", align, Align)
+
+        font_size = normalize_enum(kwargs.pop("font_size", FontSize.NONE), FontSize)
+        cls.__validate_attr("font_size", font_size, FontSize)
+
+        font_style = normalize_enum(kwargs.pop("font_style", FontStyle.NORMAL), FontStyle)
+        cls.__validate_attr("font_style", font_style, FontStyle)
+
+        font_weight = normalize_enum(kwargs.pop("font_weight", FontWeight.NORMAL), FontWeight)
+        cls.__validate_attr("font_weight", font_weight, FontWeight)
+
+        thousand_separator = cls.__normalie_thousand_separator(
+            normalize_enum(
+                kwargs.pop("thousand_separator", ThousandSeparator.NONE), ThousandSeparator
+            )
+        )
+        cls.__validate_attr("thousand_separator", thousand_separator, ThousandSeparator)
+
+        return (align, font_size, font_style, font_weight, thousand_separator)
+
+    @staticmethod
+    def __validate_attr(attr_name, value, expected_type):
         if value is not None and not isinstance(value, expected_type):
             raise TypeError(
                 "{} must be a {} instancce: actual={}".format(
@@ -171,3 +234,13 @@ class Style(object):
             return value
 
         return norm_value
+
+
+def _make_style(style_class, align, font_size, font_style, font_weight, thousand_separator):
+    return style_class(
+        align=align,
+        font_size=font_size,
+        font_style=font_style,
+        font_weight=font_weight,
+        thousand_separator=thousand_separator,
+    )
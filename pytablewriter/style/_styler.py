@@ -26,6 +26,10 @@ class StylerInterface(object):
 
 
 class AbstractStyler(StylerInterface):
+    @property
+    def style(self):
+        return self._style
+
     @property
     def _font_size_map(self):
         return {}
@@ -6,16 +6,56 @@
 
 from __future__ import absolute_import, unicode_literals
 
+import collections
 import copy
+import sys
+import threading
+import time
+from decimal import Decimal
 
 import dataproperty
 import msgfy
-from six.moves import zip
+import six
+from six.moves import queue, range, zip
 from typepy import Typecode
 
+from ..error import BulkIndexError
+from ..sanitizer import sanitize_headers
 from ._table_writer import AbstractTableWriter
 
 
+try:
+    import simplejson as json
+except ImportError:
+    import json
+
+
+_BULK_ERROR_SAMPLE_SIZE = 5
+_BULK_RETRY_STATUS_CODES = (429, 503)
+_BULK_LOAD_INDEX_SETTINGS = {"refresh_interval": "-1", "number_of_replicas": 0}
+_INDEX_EXISTS_ERRORS = ("index_already_exists_exception", "resource_already_exists_exception")
+
+BulkResult = collections.namedtuple("BulkResult", "success_count error_list")
+
+
+def _to_json_default(value):
+    if isinstance(value, Decimal):
+        return float(value)
+
+    return six.text_type(value)
+
+
+def _to_error_type(error):
+    if isinstance(error.get("error"), dict):
+        return error["error"].get("type", "unknown")
+
+    return six.text_type(error.get("error"))
+
+
+def _to_bulk_line(value):
+    return json.dumps(value, default=_to_json_default, ensure_ascii=False)
+
+
 class ElasticsearchWriter(AbstractTableWriter):
     """
     A table writer class for Elasticsearch.
@@ -31,21 +71,105 @@ class ElasticsearchWriter(AbstractTableWriter):
 
         Specify document type for indices. Defaults to ``"table"``.
 
+    .. py:attribute:: bulk_chunk_size
+
+        Maximum number of documents sent by a bulk API request.
+        Defaults to ``500``.
+
+    .. py:attribute:: bulk_max_chunk_bytes
+
+        Maximum size in bytes of a bulk API request body.
+        Defaults to ``100 * 1024 * 1024``.
+
+    .. py:attribute:: bulk_thread_count
+
+        Number of threads that send bulk API requests concurrently.
+        Chunks held in memory at the same time are bounded by
+        ``bulk_thread_count * 2 + 1`` regardless of the table size.
+        Defaults to ``1`` (chunks are sent sequentially).
+
+    .. py:attribute:: bulk_max_retries
+
+        Maximum number of retries for documents rejected with
+        ``429 Too Many Requests``/``503 Service Unavailable``.
+        Defaults to ``3``.
+
+    .. py:attribute:: bulk_initial_backoff
+
+        Seconds to wait before the first retry.
+        The wait time is doubled at each retry up to
+        :py:attr:`~pytablewriter.ElasticsearchWriter.bulk_max_backoff` seconds.
+        Defaults to ``2``.
+
+    .. py:attribute:: bulk_max_backoff
+
+        Maximum seconds to wait between retries. Defaults to ``600``.
+
+    .. py:attribute:: index_settings
+
+        Index settings (e.g. ``{"number_of_shards": 1, "refresh_interval": "30s"}``)
+        used to create the index. Defaults to |None|.
+
+    .. py:attribute:: is_bulk_load_tuning
+
+        If |True|, the index is set to ``refresh_interval: -1`` and
+        ``number_of_replicas: 0`` while loading documents.
+        After the load, these settings are restored to the values of the
+        :py:attr:`~pytablewriter.ElasticsearchWriter.index_settings`
+        (or the values before the load) and the index is refreshed.
+        Defaults to |False|.
+
+    .. py:attribute:: force_merge_max_num_segments
+
+        If the value is not |None|, the index is force-merged to the
+        number of segments after loading documents.
+        Defaults to |None|.
+
+    .. py:attribute:: is_raise_on_bulk_error
+
+        If |True|, :py:class:`~pytablewriter.BulkIndexError` is raised when
+        any of the documents failed to index after retries.
+        The failures are only logged if |False|.
+        Defaults to |False|.
+
     .. py:method:: write_table()
 
         Create an index and put documents for each row to Elasticsearch.
+        Documents are sent by the
+        `bulk API <https://www.elastic.co/guide/en/elasticsearch/reference/current/docs-bulk.html>`__
+        in chunks of
+        :py:attr:`~pytablewriter.ElasticsearchWriter.bulk_chunk_size` documents
+        (or :py:attr:`~pytablewriter.ElasticsearchWriter.bulk_max_chunk_bytes` bytes).
+        Rejected documents are retried with exponential backoff.
+        Documents that failed to index are logged at once after all of
+        the chunks are sent, as the number of failures for each error type
+        and a few samples of the failed documents.
 
         You need to pass an
         `elasticsearch.Elasticsearch <https://elasticsearch-py.rtfd.io/en/master/api.html#elasticsearch>`__
-        instance to |stream| before calling this method.
+        instance (or an object that has the same ``bulk``/``indices`` APIs)
+        to |stream| before calling this method.
         |table_name|/:py:attr:`~pytablewriter.ElasticsearchWriter.index_name`
         used as the creating index name,
         invalid characters in the name are replaced with underscore (``'_'``).
         Document data types for documents are automatically detected
         from the data.
 
+        An iterator (e.g. a generator or a DB cursor) can be set to the
+        |value_matrix|, in that case, the mappings of the index are determined
+        from the first ``batch_size`` rows (and the |type_hints|),
+        and the following rows are converted to documents while loading
+        without holding the whole table in memory.
+        With :py:meth:`~.write_table_iter`, the index is created only once
+        with the first iteration.
+
         :raises ValueError:
-            If the |stream| has not elasticsearch.Elasticsearch instance.
+            If the |stream| does not have ``bulk``/``indices`` APIs of
+            an Elasticsearch client.
+        :raises pytablewriter.BulkIndexError:
+            If any of the documents failed to index after retries and
+            :py:attr:`~pytablewriter.ElasticsearchWriter.is_raise_on_bulk_error`
+            is |True|.
         :Example:
             :ref:`example-elasticsearch-table-writer`
     """
@@ -66,11 +190,11 @@ class ElasticsearchWriter(AbstractTableWriter):
 
     @table_name.setter
     def table_name(self, value):
-        from ..sanitizer import ElasticsearchIndexNameSanitizer
+        from ..sanitizer import sanitize_es_index_name
         from pathvalidate import ValidationError, ErrorReason
 
         try:
-            self._table_name = ElasticsearchIndexNameSanitizer(value).sanitize(replacement_text="_")
+            self._table_name = sanitize_es_index_name(value, replacement_text="_")
         except ValidationError as e:
             if e.reason is ErrorReason.NULL_NAME:
                 self._table_name = None
@@ -96,6 +220,20 @@ class ElasticsearchWriter(AbstractTableWriter):
         self._dp_extractor.type_value_map = copy.deepcopy(dataproperty.DefaultValue.TYPE_VALUE_MAP)
 
         self.document_type = "table"
+        self.bulk_chunk_size = 500
+        self.bulk_max_chunk_bytes = 100 * 1024 * 1024
+        self.bulk_thread_count = 1
+        self.bulk_max_retries = 3
+        self.bulk_initial_backoff = 2
+        self.bulk_max_backoff = 600
+        self.index_settings = None
+        self.is_bulk_load_tuning = False
+        self.force_merge_max_num_segments = None
+        self.is_raise_on_bulk_error = False
+
+        self.__is_writing_iter = False
+        self.__is_index_opened = False
+        self.__restore_index_settings = None
 
     def write_null_line(self):
         pass
@@ -146,13 +284,15 @@ class ElasticsearchWriter(AbstractTableWriter):
     def _get_mappings(self):
         properties = {}
 
-        for header, column_dp in zip(self.headers, self._column_dp_list):
-            properties[header] = self.__get_es_datatype(column_dp)
+        field_names = sanitize_headers(self.headers, "elasticsearch")
+        for field_name, column_dp in zip(field_names, self._column_dp_list):
+            properties[field_name] = self.__get_es_datatype(column_dp)
 
         return {"mappings": {self.document_type: {"properties": properties}}}
 
     def _get_body(self):
         str_datatype = (Typecode.DATETIME, Typecode.IP_ADDRESS, Typecode.INFINITY, Typecode.NAN)
+        field_names = sanitize_headers(self.headers, "elasticsearch")
 
         for value_dp_list in self._table_value_dp_matrix:
             value_list = [
@@ -160,34 +300,358 @@ class ElasticsearchWriter(AbstractTableWriter):
                 for value_dp in value_dp_list
             ]
 
-            yield dict(zip(self.headers, value_list))
+            yield dict(zip(field_names, value_list))
 
-    def _write_table(self):
-        import elasticsearch as es
+    def write_table(self):
+        with self._logger:
+            self._verify_property()
+
+            if self._is_iterator_value_matrix():
+                self.__write_table_stream()
+            else:
+                self._write_table()
 
-        if not isinstance(self.stream, es.Elasticsearch):
-            raise ValueError("stream must be an elasticsearch.Elasticsearch instance")
+    def _write_table(self):
+        self.__verify_stream()
 
         self._verify_value_matrix()
         self._preprocess()
 
-        mappings = self._get_mappings()
+        if not self.__is_writing_iter:
+            self._load_documents(self.__create_index())
+            return
+
+        # write_table_iter: the index created only once with the first iteration
+        if not self.__is_index_opened:
+            self.__open_index(self.__create_index())
+
+        self._write_documents()
+
+    def _write_table_iter(self):
+        self.__is_writing_iter = True
+
+        try:
+            super(ElasticsearchWriter, self)._write_table_iter()
+        finally:
+            self.__is_writing_iter = False
+            self.__close_index()
+
+    def _get_create_index_settings(self):
+        settings = dict(self.index_settings or {})
+
+        if self.is_bulk_load_tuning:
+            # an index created with load time settings: no need to update settings before loading
+            settings.update(_BULK_LOAD_INDEX_SETTINGS)
+
+        return settings
+
+    def _load_documents(self, is_created, body_iter=None):
+        self.__open_index(is_created)
 
         try:
-            result = self.stream.indices.create(index=self.index_name, body=mappings)
+            self._write_documents(body_iter)
+        finally:
+            self.__close_index()
+
+    def _write_documents(self, body_iter=None):
+        lock = threading.Lock()
+        success_count = [0]
+        error_type_counter = collections.Counter()
+        error_sample_list = []
+
+        def add_result(result):
+            # only a few of failed documents are kept in memory, others are counted
+            with lock:
+                success_count[0] += result.success_count
+                error_type_counter.update(_to_error_type(error) for error in result.error_list)
+                error_sample_list.extend(
+                    result.error_list[: _BULK_ERROR_SAMPLE_SIZE - len(error_sample_list)]
+                )
+
+        if body_iter is None:
+            body_iter = self._get_body()
+
+        chunk_iter = self._iter_bulk_chunks(body_iter)
+
+        if self.bulk_thread_count > 1:
+            self.__send_bulk_chunks_parallel(chunk_iter, add_result)
+        else:
+            for chunk in chunk_iter:
+                add_result(self._send_bulk_chunk_with_retry(chunk))
+
+        failed_count = sum(error_type_counter.values())
+        self._logger.logger.info(
+            "indexed {:d} documents to '{}' (failed: {:d})".format(
+                success_count[0], self.index_name, failed_count
+            )
+        )
+
+        if not failed_count:
+            return
+
+        self.__log_bulk_errors(
+            success_count[0], failed_count, error_type_counter, error_sample_list
+        )
+
+        if self.is_raise_on_bulk_error:
+            raise BulkIndexError(
+                "failed to index {:d} documents to '{}'".format(failed_count, self.index_name),
+                success_count=success_count[0],
+                error_list=error_sample_list,
+                failed_count=failed_count,
+            )
+
+    def _iter_bulk_chunks(self, body_iter):
+        """
+        Yield lists of serialized ``(action, document)`` line pairs for bulk API requests.
+        """
+
+        action_line = _to_bulk_line({"index": {}})
+        action_size = len(action_line.encode("utf-8")) + 1
+        max_chunk_size = max(self.bulk_chunk_size, 1)
+        chunk = []
+        chunk_bytes = 0
+
+        for body in body_iter:
+            body_line = _to_bulk_line(body)
+            item_bytes = action_size + len(body_line.encode("utf-8")) + 1
+
+            if chunk and (
+                len(chunk) >= max_chunk_size or chunk_bytes + item_bytes > self.bulk_max_chunk_bytes
+            ):
+                yield chunk
+                chunk = []
+                chunk_bytes = 0
+
+            chunk.append((action_line, body_line))
+            chunk_bytes += item_bytes
+
+        if chunk:
+            yield chunk
+
+    def _send_bulk_chunk(self, chunk):
+        request_body = "".join(
+            "{:s}\n{:s}\n".format(action_line, body_line) for action_line, body_line in chunk
+        )
+        response = self.stream.bulk(
+            body=request_body, index=self.index_name, doc_type=self.document_type
+        )
+
+        if not response.get("errors"):
+            return BulkResult(len(chunk), [])
+
+        error_list = []
+        for item, (_action_line, body_line) in zip(response.get("items", []), chunk):
+            _op_type, item_result = list(item.items())[0]
+            if "error" in item_result:
+                error_list.append(
+                    {
+                        "status": item_result.get("status"),
+                        "error": item_result["error"],
+                        "body": body_line,
+                    }
+                )
+
+        return BulkResult(len(chunk) - len(error_list), error_list)
+
+    def _send_bulk_chunk_with_retry(self, chunk):
+        success_count = 0
+        error_list = []
+
+        for retry_count in range(max(self.bulk_max_retries, 0) + 1):
+            is_last_attempt = retry_count >= self.bulk_max_retries
+
+            if retry_count > 0:
+                time.sleep(self.__get_backoff(retry_count))
+
+            try:
+                result = self._send_bulk_chunk(chunk)
+            except Exception as e:
+                # whole request rejected (e.g. elasticsearch.TransportError with status 429)
+                if (
+                    is_last_attempt
+                    or getattr(e, "status_code", None) not in _BULK_RETRY_STATUS_CODES
+                ):
+                    raise
+
+                self._logger.logger.debug(
+                    "bulk request rejected: retry={:d}, {}".format(
+                        retry_count + 1, msgfy.to_error_message(e)
+                    )
+                )
+                continue
+
+            success_count += result.success_count
+            retry_error_list = []
+            for error in result.error_list:
+                if not is_last_attempt and error["status"] in _BULK_RETRY_STATUS_CODES:
+                    retry_error_list.append(error)
+                else:
+                    error_list.append(error)
+
+            if not retry_error_list:
+                break
+
+            self._logger.logger.debug(
+                "{:d} documents rejected: retry={:d}".format(len(retry_error_list), retry_count + 1)
+            )
+            action_line = chunk[0][0]
+            chunk = [(action_line, error["body"]) for error in retry_error_list]
+
+        return BulkResult(success_count, error_list)
+
+    def __send_bulk_chunks_parallel(self, chunk_iter, add_result):
+        # the queue size bounds the number of chunks that held in memory
+        chunk_queue = queue.Queue(maxsize=self.bulk_thread_count)
+        exc_info_list = []
+
+        def send_chunks():
+            while True:
+                chunk = chunk_queue.get()
+                if chunk is None:
+                    return
+
+                if exc_info_list:
+                    # discard remaining chunks after an error occurred
+                    continue
+
+                try:
+                    add_result(self._send_bulk_chunk_with_retry(chunk))
+                except Exception:
+                    exc_info_list.append(sys.exc_info())
+
+        thread_list = [threading.Thread(target=send_chunks) for _i in range(self.bulk_thread_count)]
+        for thread in thread_list:
+            thread.daemon = True
+            thread.start()
+
+        try:
+            for chunk in chunk_iter:
+                if exc_info_list:
+                    break
+
+                chunk_queue.put(chunk)
+        finally:
+            for _thread in thread_list:
+                chunk_queue.put(None)
+            for thread in thread_list:
+                thread.join()
+
+        if exc_info_list:
+            six.reraise(*exc_info_list[0])
+
+    def __write_table_stream(self):
+        self.__verify_stream()
+        chunk_iter = self._iter_value_matrix_chunks(self.batch_size)
+
+        try:
+            # mappings are determined from the first chunk (and the type_hints)
+            next(chunk_iter)
+            self._verify_value_matrix()
+            self._preprocess()
+
+            self._load_documents(self.__create_index(), self.__iter_stream_body(chunk_iter))
+        finally:
+            chunk_iter.close()
+
+    def __iter_stream_body(self, chunk_iter):
+        for body in self._get_body():
+            yield body
+
+        for _is_final_chunk in chunk_iter:
+            self._preprocess()
+
+            for body in self._get_body():
+                yield body
+
+    def __create_index(self):
+        body = self._get_mappings()
+        settings = self._get_create_index_settings()
+        if settings:
+            body["settings"] = settings
+
+        try:
+            result = self.stream.indices.create(index=self.index_name, body=body)
             self._logger.logger.debug(result)
-        except es.TransportError as e:
-            if e.error == "index_already_exists_exception":
+        except Exception as e:
+            # elasticsearch.TransportError: the error type is stored to the error attribute
+            if getattr(e, "error", None) in _INDEX_EXISTS_ERRORS:
                 # ignore already existing index
                 self._logger.logger.debug(msgfy.to_error_message(e))
-            else:
-                raise
+                return False
 
-        for body in self._get_body():
-            try:
-                self.stream.index(index=self.index_name, body=body, doc_type=self.document_type)
-            except es.exceptions.RequestError as e:
-                self._logger.logger.error("{}, body={}".format(msgfy.to_error_message(e), body))
+            raise
+
+        return True
+
+    def __open_index(self, is_created):
+        self.__restore_index_settings = None
+
+        if self.is_bulk_load_tuning:
+            self.__restore_index_settings = self.__get_restore_index_settings(is_created)
+
+            if not is_created:
+                self.__put_index_settings(_BULK_LOAD_INDEX_SETTINGS)
+
+        self.__is_index_opened = True
+
+    def __close_index(self):
+        if not self.__is_index_opened:
+            return
+
+        self.__is_index_opened = False
+
+        if self.__restore_index_settings is not None:
+            self.__put_index_settings(self.__restore_index_settings)
+            self.__restore_index_settings = None
+            self.stream.indices.refresh(index=self.index_name)
+
+        if self.force_merge_max_num_segments is not None:
+            result = self.stream.indices.forcemerge(
+                index=self.index_name, max_num_segments=self.force_merge_max_num_segments
+            )
+            self._logger.logger.debug(result)
+
+    def __verify_stream(self):
+        if not all(hasattr(self.stream, attr) for attr in ("bulk", "indices")):
+            raise ValueError(
+                "stream must be an Elasticsearch client (e.g. elasticsearch.Elasticsearch): "
+                "actual={}".format(type(self.stream))
+            )
+
+    def __get_restore_index_settings(self, is_created):
+        index_settings = self.index_settings or {}
+        current_settings = {}
+
+        if not is_created:
+            result = self.stream.indices.get_settings(index=self.index_name)
+            current_settings = result.get(self.index_name, {}).get("settings", {}).get("index", {})
+
+        # None resets a setting to the default value of Elasticsearch
+        return {
+            key: index_settings.get(key, current_settings.get(key))
+            for key in _BULK_LOAD_INDEX_SETTINGS
+        }
+
+    def __put_index_settings(self, settings):
+        result = self.stream.indices.put_settings(index=self.index_name, body={"index": settings})
+        self._logger.logger.debug(result)
+
+    def __get_backoff(self, retry_count):
+        return min(self.bulk_initial_backoff * (2 ** (retry_count - 1)), self.bulk_max_backoff)
+
+    def __log_bulk_errors(self, success_count, failed_count, error_type_counter, error_list):
+        self._logger.logger.error(
+            "failed to index {:d} documents (succeeded: {:d}) to '{}': errors={}".format(
+                failed_count, success_count, self.index_name, dict(error_type_counter)
+            )
+        )
+        for error in error_list:
+            self._logger.logger.error(
+                "status={}, error={}, body={}".format(
+                    error.get("status"), error.get("error"), error.get("body")
+                )
+            )
 
     def _write_value_row_separator(self):
         pass
@@ -7,6 +7,8 @@
 from __future__ import absolute_import, unicode_literals
 
 import abc
+import functools
+import itertools
 import math
 import re
 import warnings
@@ -39,6 +41,73 @@ _ts_to_flag = {
 }
 
 
+def _is_same_format_flags(lhs, rhs):
+    # format flags of columns that are not included in a list are Format.NONE
+    lhs = lhs or []
+    rhs = rhs or []
+    size = max(len(lhs), len(rhs))
+
+    return list(lhs) + [Format.NONE] * (size - len(lhs)) == list(rhs) + [Format.NONE] * (
+        size - len(rhs)
+    )
+
+
+# types of which equal values are always converted to the same string
+# (e.g. Decimal("1.1") == Decimal("1.10") and 0.0 == -0.0 are not included)
+_MEMOIZABLE_TYPES = frozenset(
+    (six.text_type, six.binary_type, bool, type(None)) + six.integer_types
+)
+
+
+class _RowItemMemo(object):
+    """
+    A bounded memo of row items (value -> styled and padded string) for a column.
+    The hit ratio of the memo is checked for every ``SAMPLE_SIZE`` lookups, and
+    the memo is disabled when the ratio of misses in a sample is high
+    (e.g. a high cardinality column, or the memo is full of values that no longer appear).
+    """
+
+    MAX_SIZE = 1024
+    SAMPLE_SIZE = 128
+    MAX_MISS_RATIO = 0.5
+
+    def __init__(self, to_row_item, col_dp):
+        self.__to_row_item = to_row_item
+        self.__col_dp = col_dp
+        self.__memo = {}
+        self.__lookup_count = 0
+        self.__miss_count = 0
+        self.is_enabled = True
+
+    def to_row_item(self, value_dp):
+        data = value_dp.data
+
+        if not self.is_enabled or type(data) not in _MEMOIZABLE_TYPES:
+            return self.__to_row_item(self.__col_dp, value_dp)
+
+        key = (value_dp.typecode, type(data), data)
+        self.__lookup_count += 1
+
+        try:
+            row_item = self.__memo[key]
+        except KeyError:
+            row_item = self.__to_row_item(self.__col_dp, value_dp)
+            self.__miss_count += 1
+
+            if len(self.__memo) < self.MAX_SIZE:
+                self.__memo[key] = row_item
+
+        if self.__lookup_count >= self.SAMPLE_SIZE:
+            if self.__miss_count > self.__lookup_count * self.MAX_MISS_RATIO:
+                self.is_enabled = False
+                self.__memo = {}
+
+            self.__lookup_count = 0
+            self.__miss_count = 0
+
+        return row_item
+
+
 class AbstractTableWriter(TableWriterInterface):
     """
     An abstract base class of table writer classes.
@@ -71,6 +140,12 @@ class AbstractTableWriter(TableWriterInterface):
         This value used in :py:meth:`.write_table_iter` method.
         (defaults to ``-1`` which means number of iterations is indefinite)
 
+    .. py:attribute:: batch_size
+
+        The number of rows processed at once by writers that write rows
+        in batches, or that consume an iterator set to the |value_matrix|.
+        Defaults to ``1024``.
+
     .. py:attribute:: write_callback
 
         The value expected to a function.
@@ -99,7 +174,7 @@ class AbstractTableWriter(TableWriterInterface):
             return
 
         self._dp_extractor.is_formatting_float = value
-        self.__clear_preprocess()
+        self._clear_preprocess()
 
     @property
     def table_name(self):
@@ -148,7 +223,7 @@ class AbstractTableWriter(TableWriterInterface):
     @value_matrix.setter
     def value_matrix(self, value_matrix):
         self.__set_value_matrix(value_matrix)
-        self.__clear_preprocess()
+        self._clear_preprocess()
 
     @property
     def tabledata(self):
@@ -205,7 +280,7 @@ class AbstractTableWriter(TableWriterInterface):
             return
 
         self.__set_type_hints(value)
-        self.__clear_preprocess()
+        self._clear_preprocess()
 
     @property
     def type_hint_list(self):
@@ -235,7 +310,7 @@ class AbstractTableWriter(TableWriterInterface):
         )
 
         self.__align_list = value
-        self.__clear_preprocess()
+        self._clear_preprocess()
 
     @property
     def format_list(self):
@@ -253,7 +328,7 @@ class AbstractTableWriter(TableWriterInterface):
         )
 
         self._dp_extractor.format_flags_list = value
-        self.__clear_preprocess()
+        self._clear_preprocess()
 
     def __get_thousand_separator(self, col_idx):
         thousand_separator = self._get_style_attr_from_style(col_idx, "thousand_separator")
@@ -290,16 +365,7 @@ class AbstractTableWriter(TableWriterInterface):
             return
 
         self.__style_list = value
-
-        if self.__style_list:
-            self._dp_extractor.format_flags_list = [
-                _ts_to_flag[self.__get_thousand_separator(col_idx)]
-                for col_idx in range(len(self.__style_list))
-            ]
-        else:
-            self._dp_extractor.format_flags_list = []
-
-        self.__clear_preprocess()
+        self.__update_format_flags()
 
     @property
     def style_list(self):
@@ -331,11 +397,11 @@ class AbstractTableWriter(TableWriterInterface):
             return
 
         self._dp_extractor.trans_func = value
-        self.__clear_preprocess()
+        self._clear_preprocess()
 
     def register_trans_func(self, trans_func):
         self._dp_extractor.register_trans_func(trans_func)
-        self.__clear_preprocess()
+        self._clear_preprocess()
 
     @property
     def line_break_handling(self):
@@ -347,7 +413,7 @@ class AbstractTableWriter(TableWriterInterface):
             return
 
         self._dp_extractor.line_break_handling = normalize_enum(value, LineBreakHandling)
-        self.__clear_preprocess()
+        self._clear_preprocess()
 
     @property
     def is_escape_html_tag(self):
@@ -356,7 +422,7 @@ class AbstractTableWriter(TableWriterInterface):
     @is_escape_html_tag.setter
     def is_escape_html_tag(self, flag):
         self._dp_extractor.is_escape_html_tag = flag
-        self.__clear_preprocess()
+        self._clear_preprocess()
 
     @property
     def stream(self):
@@ -373,7 +439,7 @@ class AbstractTableWriter(TableWriterInterface):
     @_quoting_flags.setter
     def _quoting_flags(self, value):
         self._dp_extractor.quoting_flags = value
-        self.__clear_preprocess()
+        self._clear_preprocess()
 
     @abc.abstractmethod
     def _write_table(self):
@@ -429,10 +495,12 @@ class AbstractTableWriter(TableWriterInterface):
         self.line_break_handling = LineBreakHandling.NOP
 
         self.iteration_length = -1
+        self.batch_size = 1024
         self.write_callback = lambda _iter_count, _iter_length: None  # NOP
         self._iter_count = None
 
         self.__align_list = []
+        self._conditional_style_table = {}
         self.__align_char_mapping = {
             Align.AUTO: "<",
             Align.LEFT: "<",
@@ -442,7 +510,7 @@ class AbstractTableWriter(TableWriterInterface):
 
         self.__style_list = []
 
-        self.__clear_preprocess()
+        self._clear_preprocess()
 
     def _repr_html_(self):
         from .text._html import HtmlTableWriter
@@ -468,28 +536,74 @@ class AbstractTableWriter(TableWriterInterface):
             ValueError: If the column specifier is invalid.
         """
 
-        column_idx = None
-
         while len(self.headers) > len(self.__style_list):
             self.__style_list.append(None)
 
+        column_idx = self.__to_column_idx(column)
+
+        if self.__style_list[column_idx] is style:
+            # styles are interned: the same style already set to the column
+            return
+
+        self.__style_list[column_idx] = style
+        self.__update_format_flags()
+
+    def set_conditional_style(self, column, style_func, styles):
+        """Set styles that applied to cells of a specific column conditionally.
+
+        The ``style_func`` is called once for each table (or each chunk of
+        the table) with a list of the values of the column, instead of called
+        for each cell. The function returns style indices for each row:
+        ``styles[index]`` applied to the cell of the row,
+        |None| or a negative index means the style of the column.
+        Conditional styles are applied by the stylers of the writer
+        (e.g. font weight/style/size), alignments and thousand separators
+        are determined for each column by :py:meth:`~.set_style`.
+
+        Args:
+            column (|int| or |str|):
+                Column specifier. column index or header name correlated with the column.
+            style_func (callable):
+                A function that accepts a list of the column values and
+                returns a sequence of style indices (e.g. a ``numpy.ndarray``) for each row.
+                If the value is |None|, the conditional style of the column is removed.
+            styles (list of |Style|):
+                Styles for the style indices.
+
+        Raises:
+            ValueError: If the column specifier is invalid.
+
+        :Example:
+            .. code:: python
+
+                import numpy as np
+
+                writer.set_conditional_style(
+                    "value",
+                    lambda values: np.where(np.asarray(values, dtype=float) < 0, 0, -1),
+                    [Style(font_weight="bold")],
+                )
+        """
+
+        column_idx = self.__to_column_idx(column)
+
+        if style_func is None:
+            self._conditional_style_table.pop(column_idx, None)
+        else:
+            self._conditional_style_table[column_idx] = (style_func, list(styles))
+
+        self._clear_preprocess()
+
+    def __to_column_idx(self, column):
         if isinstance(column, six.integer_types):
-            column_idx = column
-        elif isinstance(column, six.string_types):
+            return column
+
+        if isinstance(column, six.string_types):
             try:
-                column_idx = self.headers.index(column)
-            except ValueError:
+                return self.headers.index(column)
+            except (AttributeError, ValueError):
                 pass
 
-        if column_idx is not None:
-            self.__style_list[column_idx] = style
-            self.__clear_preprocess()
-            self._dp_extractor.format_flags_list = [
-                _ts_to_flag[self.__get_thousand_separator(col_idx)]
-                for col_idx in range(len(self.__style_list))
-            ]
-            return
-
         raise ValueError("column must be an int or string")
 
     def close(self):
@@ -555,7 +669,7 @@ class AbstractTableWriter(TableWriterInterface):
         :param tabledata.TableData value: Input table data.
         """
 
-        self.__clear_preprocess()
+        self._clear_preprocess()
 
         if is_overwrite_table_name:
             self.table_name = value.table_name
@@ -573,6 +687,7 @@ class AbstractTableWriter(TableWriterInterface):
         self.__set_type_hints([col_dp.type_class for col_dp in self._column_dp_list])
 
         self._is_complete_table_dp_preprocess = True
+        self.__is_complete_value_dp_matrix = True
 
     def from_csv(self, csv_source, delimiter=","):
         """
@@ -729,6 +844,77 @@ class AbstractTableWriter(TableWriterInterface):
             self.is_write_closing_row = stash_is_write_closing_row
             self._iter_count = None
 
+    def _is_iterator_value_matrix(self):
+        value_matrix = self.value_matrix
+
+        if value_matrix is None:
+            return False
+
+        try:
+            return iter(value_matrix) is value_matrix
+        except TypeError:
+            return False
+
+    def _iter_value_matrix_chunks(self, chunk_size):
+        """
+        Consume the |value_matrix| iterator by ``chunk_size`` rows.
+        Each chunk is set as the current value matrix while it is processed,
+        column properties are carried over between the chunks.
+        Yield |True| for the final chunk, at least one (possibly empty)
+        chunk is always yielded.
+        """
+
+        value_matrix = self.value_matrix
+        row_iter = iter(value_matrix)
+        chunk_size = max(chunk_size, 1)
+
+        try:
+            work_matrix = list(itertools.islice(row_iter, chunk_size))
+
+            while True:
+                next_work_matrix = list(itertools.islice(row_iter, chunk_size))
+
+                self.__set_value_matrix(work_matrix)
+                self.__clear_preprocess_status()
+
+                yield not next_work_matrix
+
+                if not next_work_matrix:
+                    break
+
+                work_matrix = next_work_matrix
+        finally:
+            self.__set_value_matrix(value_matrix)
+
+    def _write_table_chunks(self):
+        """
+        Write a table from an iterator |value_matrix| by ``batch_size`` rows.
+        Opening row and headers are written with the first chunk,
+        and closing row is written with the final chunk.
+        """
+
+        stash_is_write_header = self.is_write_header
+        stash_is_write_opening_row = self.is_write_opening_row
+        stash_is_write_closing_row = self.is_write_closing_row
+
+        try:
+            is_first_chunk = True
+
+            for is_final_chunk in self._iter_value_matrix_chunks(self.batch_size):
+                if not is_first_chunk and self.is_write_value_separator_row:
+                    self._write_value_row_separator()
+
+                self.is_write_closing_row = stash_is_write_closing_row and is_final_chunk
+                self._write_table()
+
+                self.is_write_opening_row = False
+                self.is_write_header = False
+                is_first_chunk = False
+        finally:
+            self.is_write_header = stash_is_write_header
+            self.is_write_opening_row = stash_is_write_opening_row
+            self.is_write_closing_row = stash_is_write_closing_row
+
     def _get_padding_len(self, column_dp, value_dp=None):
         if not self.is_padding:
             return 0
@@ -748,8 +934,9 @@ class AbstractTableWriter(TableWriterInterface):
     def _get_header_format_string(_col_dp, _value_dp):
         return "{:s}"
 
-    def _to_row_item(self, col_dp, value_dp):
-        styler = self._styler_list[col_dp.column_index]
+    def _to_row_item(self, col_dp, value_dp, styler=None):
+        if styler is None:
+            styler = self._styler_list[col_dp.column_index]
 
         return self.__get_align_format(col_dp, value_dp).format(
             styler.apply(col_dp.dp_to_str(value_dp))
@@ -882,19 +1069,22 @@ class AbstractTableWriter(TableWriterInterface):
 
         self._logger.logger.debug("_preprocess_table_dp")
 
-        if typepy.is_empty_sequence(self.headers) and self._use_default_header:
-            self.headers = [
-                convert_idx_to_alphabet(col_idx)
-                for col_idx in range(len(self.__value_matrix_org[0]))
-            ]
+        if not self.__is_complete_value_dp_matrix:
+            if typepy.is_empty_sequence(self.headers) and self._use_default_header:
+                self.headers = [
+                    convert_idx_to_alphabet(col_idx)
+                    for col_idx in range(len(self.__value_matrix_org[0]))
+                ]
 
-        try:
-            self._table_value_dp_matrix = self._dp_extractor.to_dp_matrix(
-                to_value_matrix(self.headers, self.__value_matrix_org)
-            )
-        except TypeError as e:
-            self._logger.logger.debug(msgfy.to_error_message(e))
-            self._table_value_dp_matrix = []
+            try:
+                self._table_value_dp_matrix = self._dp_extractor.to_dp_matrix(
+                    to_value_matrix(self.headers, self.__value_matrix_org)
+                )
+            except TypeError as e:
+                self._logger.logger.debug(msgfy.to_error_message(e))
+                self._table_value_dp_matrix = []
+
+            self.__is_complete_value_dp_matrix = True
 
         self._column_dp_list = self._dp_extractor.to_column_dp_list(
             self._table_value_dp_matrix, self._column_dp_list
@@ -907,6 +1097,7 @@ class AbstractTableWriter(TableWriterInterface):
             return
 
         self._styler_list = []
+        styler_table = {}
 
         for col_dp in self._column_dp_list:
             style = self.__get_style(col_dp.column_index)
@@ -914,10 +1105,103 @@ class AbstractTableWriter(TableWriterInterface):
             if style is None:
                 style = Style()
 
-            self._styler_list.append(self._create_styler(style, self))
+            self._styler_list.append(self.__get_styler(styler_table, style))
+
+        self._conditional_styler_table = {}
+        for col_idx, (style_func, style_list) in self._conditional_style_table.items():
+            if col_idx >= len(self._column_dp_list):
+                continue
+
+            self._conditional_styler_table[col_idx] = (
+                [self.__get_styler(styler_table, style) for style in style_list],
+                self.__eval_style_func(col_idx, style_func, len(style_list)),
+            )
 
         self._is_complete_styler_proprocess = True
 
+    def __update_format_flags(self):
+        format_flags_list = [
+            _ts_to_flag[self.__get_thousand_separator(col_idx)]
+            for col_idx in range(len(self.__style_list or []))
+        ]
+
+        if not _is_same_format_flags(format_flags_list, self._dp_extractor.format_flags_list):
+            # thousand separators are applied when extracting data properties
+            self._dp_extractor.format_flags_list = format_flags_list
+            self._clear_preprocess()
+            return
+
+        # other style attributes only affect stylers: keep the extracted table data
+        self.__clear_styler_preprocess()
+
+    def __clear_styler_preprocess(self):
+        # data properties of values are kept, column data properties are recreated
+        # because the widths of the columns are extended by the stylers
+        self._is_complete_table_dp_preprocess = False
+        self._is_complete_styler_proprocess = False
+        self._is_complete_table_property_preprocess = False
+        self._is_complete_header_preprocess = False
+        self._is_complete_value_matrix_preprocess = False
+
+        self._column_dp_list = []
+        self._styler_list = []
+        self._conditional_styler_table = {}
+        self._table_header_list = []
+        self._table_value_matrix = []
+
+    def __get_styler(self, styler_table, style):
+        # columns that have the same style share a styler
+        styler = styler_table.get(style)
+        if styler is None:
+            styler = self._create_styler(style, self)
+            styler_table[style] = styler
+
+        return styler
+
+    def __eval_style_func(self, col_idx, style_func, style_count):
+        value_list = [
+            value_dp_list[col_idx].data if col_idx < len(value_dp_list) else None
+            for value_dp_list in self._table_value_dp_matrix
+        ]
+        style_idx_list = [
+            None if style_idx is None or style_idx < 0 else int(style_idx)
+            for style_idx in style_func(value_list)
+        ]
+
+        if len(style_idx_list) != len(value_list):
+            raise ValueError(
+                "style function must return an index for each row: expected={}, actual={}".format(
+                    len(value_list), len(style_idx_list)
+                )
+            )
+
+        for style_idx in style_idx_list:
+            if style_idx is not None and style_idx >= style_count:
+                raise ValueError(
+                    "style index out of range: expected<{}, actual={}".format(
+                        style_count, style_idx
+                    )
+                )
+
+        return style_idx_list
+
+    def _get_cell_styler(self, row_idx, col_idx):
+        """
+        Return a styler for a cell: a conditional styler if the style function
+        of the column selected a style for the row, the styler of the column otherwise.
+        """
+
+        try:
+            styler_list, style_idx_list = self._conditional_styler_table[col_idx]
+        except KeyError:
+            return self._styler_list[col_idx]
+
+        style_idx = style_idx_list[row_idx]
+        if style_idx is None:
+            return self._styler_list[col_idx]
+
+        return styler_list[style_idx]
+
     def _preprocess_table_property(self):
         if self._is_complete_table_property_preprocess:
             return
@@ -931,9 +1215,19 @@ class AbstractTableWriter(TableWriterInterface):
         for column_dp in self._column_dp_list:
             try:
                 styler = self._styler_list[column_dp.column_index]
-                column_dp.extend_body_width(styler.additional_char_width)
             except IndexError:
-                pass
+                continue
+
+            additional_char_width = styler.additional_char_width
+            conditional_styler = self._conditional_styler_table.get(column_dp.column_index)
+            if conditional_styler:
+                styler_list, style_idx_list = conditional_styler
+                for style_idx in set(style_idx_list) - {None}:
+                    additional_char_width = max(
+                        additional_char_width, styler_list[style_idx].additional_char_width
+                    )
+
+            column_dp.extend_body_width(additional_char_width)
 
         self._is_complete_table_property_preprocess = True
 
@@ -960,16 +1254,46 @@ class AbstractTableWriter(TableWriterInterface):
             "_preprocess_value_matrix: value-rows={}".format(len(self._table_value_dp_matrix))
         )
 
+        # row items of low cardinality columns (e.g. status/enum) are converted only once
+        # for each distinct value
+        to_row_item_list = [
+            _RowItemMemo(self._to_row_item, col_dp).to_row_item for col_dp in self._column_dp_list
+        ]
+
         self._table_value_matrix = [
             [
-                self._to_row_item(col_dp, value_dp)
-                for col_dp, value_dp in zip(self._column_dp_list, value_dp_list)
+                to_row_item(value_dp)
+                for to_row_item, value_dp in zip(to_row_item_list, value_dp_list)
             ]
             for value_dp_list in self._table_value_dp_matrix
         ]
+        self.__apply_conditional_styles()
 
         self._is_complete_value_matrix_preprocess = True
 
+    def __apply_conditional_styles(self):
+        # cells are converted again with conditional stylers, grouped by the styles
+        for col_idx, (styler_list, style_idx_list) in self._conditional_styler_table.items():
+            row_idx_table = {}
+            for row_idx, style_idx in enumerate(style_idx_list):
+                if style_idx is not None and col_idx < len(self._table_value_matrix[row_idx]):
+                    row_idx_table.setdefault(style_idx, []).append(row_idx)
+
+            if not row_idx_table:
+                continue
+
+            col_dp = self._column_dp_list[col_idx]
+
+            for style_idx, row_idx_list in row_idx_table.items():
+                to_row_item = _RowItemMemo(
+                    functools.partial(self._to_row_item, styler=styler_list[style_idx]), col_dp
+                ).to_row_item
+
+                for row_idx in row_idx_list:
+                    self._table_value_matrix[row_idx][col_idx] = to_row_item(
+                        self._table_value_dp_matrix[row_idx][col_idx]
+                    )
+
     def _preprocess(self):
         self._preprocess_table_dp()
         self._preprocess_styler()
@@ -997,6 +1321,7 @@ class AbstractTableWriter(TableWriterInterface):
         self._is_complete_table_property_preprocess = False
         self._is_complete_header_preprocess = False
         self._is_complete_value_matrix_preprocess = False
+        self.__is_complete_value_dp_matrix = False
 
     def __clear_preprocess_data(self):
         try:
@@ -1015,10 +1340,11 @@ class AbstractTableWriter(TableWriterInterface):
 
         self._column_dp_list = []
         self._styler_list = []
+        self._conditional_styler_table = {}
         self._table_header_list = []
         self._table_value_matrix = []
         self._table_value_dp_matrix = []
 
-    def __clear_preprocess(self):
+    def _clear_preprocess(self):
         self.__clear_preprocess_status()
         self.__clear_preprocess_data()
@@ -11,17 +11,53 @@ import typepy
 from six.moves import range
 from typepy import Integer
 
+from ...sanitizer import sanitize_excel_sheet_name
+from ...style import Align, FontSize, FontStyle, FontWeight
 from .._common import import_error_msg_template
 from ._excel_workbook import ExcelWorkbookXls, ExcelWorkbookXlsx
 from ._interface import AbstractBinaryTableWriter
 
 
+_font_size_to_xlsx_font_size = {
+    FontSize.TINY: 8,
+    FontSize.SMALL: 9,
+    FontSize.MEDIUM: 11,
+    FontSize.LARGE: 14,
+}
+_align_to_xlsx_align = {Align.LEFT: "left", Align.RIGHT: "right", Align.CENTER: "center"}
+
+
+def _style_to_xlsx_format_property(style):
+    format_property = {}
+
+    if style.font_weight == FontWeight.BOLD:
+        format_property["bold"] = True
+
+    if style.font_style == FontStyle.ITALIC:
+        format_property["italic"] = True
+
+    if style.font_size in _font_size_to_xlsx_font_size:
+        format_property["font_size"] = _font_size_to_xlsx_font_size[style.font_size]
+
+    if style.align in _align_to_xlsx_align:
+        format_property["align"] = _align_to_xlsx_align[style.align]
+
+    return format_property
+
+
 class ExcelTableWriter(AbstractBinaryTableWriter):
     """
     An abstract class of a table writer for Excel file format.
+
+    When the rows of a table reached the row limit of a worksheet (``MAX_ROW``),
+    the rest of the rows are written to new worksheets named
+    ``<sheet name>_2``, ``<sheet name>_3``, ... .
+    Headers are repeated on each of the worksheets.
     """
 
     FORMAT_NAME = "excel"
+    MAX_ROW = None
+    MAX_SHEET_NAME_LEN = 31
 
     @property
     def format_name(self):
@@ -120,6 +156,10 @@ class ExcelTableWriter(AbstractBinaryTableWriter):
 
         self._current_data_row = self._first_data_row
 
+        self.__sheet_name = None
+        self.__sheet_count = 1
+        self.__is_header_written = False
+
         self._quoting_flags = copy.deepcopy(dataproperty.NOT_QUOTING_FLAGS)
         self._quoting_flags[typepy.Typecode.DATETIME] = True
 
@@ -130,7 +170,11 @@ class ExcelTableWriter(AbstractBinaryTableWriter):
         """
         Open an Excel workbook file.
 
-        :param str file_path: Excel workbook file path to open.
+        :param file_path:
+            Excel workbook file path to open.
+            A binary file object (e.g. :py:class:`io.BytesIO`) is also accepted:
+            the workbook is written to the object when closed.
+        :type file_path: str or file object
         """
 
         if self.is_opened() and self.workbook.file_path == file_path:
@@ -199,12 +243,33 @@ class ExcelTableWriter(AbstractBinaryTableWriter):
         self._stream = self.workbook.add_worksheet(sheet_name)
         self._current_data_row = self._first_data_row
 
+        self.__sheet_name = self.stream.name
+        self.__sheet_count = 1
+        self.__is_header_written = False
+
+    def write_table(self):
+        """
+        |write_table|.
+        An iterator (e.g. a generator) can be set to the |value_matrix|,
+        in that case, rows are written in order by ``batch_size`` rows
+        without holding the whole table in memory.
+        """
+
+        with self._logger:
+            self._verify_property()
+
+            if not self._is_iterator_value_matrix():
+                self._write_table()
+                return
+
+            self._write_table_chunks()
+
     def dump(self, output, close_after_write=True):
         """Write a worksheet to the current workbook.
 
         Args:
-            output (str):
-                Path to the workbook file to write.
+            output (str or file object):
+                Path to the workbook file to write, or a binary file object.
             close_after_write (bool, optional):
                 Close the workbook after write.
                 Defaults to |True|.
@@ -226,16 +291,54 @@ class ExcelTableWriter(AbstractBinaryTableWriter):
         self._write_value_matrix()
         self._postprocess()
 
+        if self.is_write_header:
+            self.__is_header_written = True
+
     def _write_value_row_separator(self):
         pass
 
     def _write_value_matrix(self):
         for value_dp_list in self._table_value_dp_matrix:
+            if self._current_data_row >= self.MAX_ROW:
+                self._rollover_worksheet()
+
             for col_idx, value_dp in enumerate(value_dp_list):
                 self._write_cell(self._current_data_row, col_idx, value_dp)
 
             self._current_data_row += 1
 
+    def _rollover_worksheet(self):
+        """
+        Finish the current worksheet and continue writing
+        to the next worksheet of the table.
+        """
+
+        self._postprocess()
+
+        self.__sheet_count += 1
+        suffix = "_{:d}".format(self.__sheet_count)
+        sheet_name = sanitize_excel_sheet_name(self.__sheet_name)
+        sheet_name = sheet_name[: self.MAX_SHEET_NAME_LEN - len(suffix)] + suffix
+
+        self._logger.logger.debug(
+            "reached the row limit ({:d}): continue writing to '{:s}' worksheet".format(
+                self.MAX_ROW, sheet_name
+            )
+        )
+
+        self._stream = self.workbook.add_worksheet(sheet_name)
+        self._current_data_row = self._first_data_row
+
+        if not self.__is_header_written and not self.is_write_header:
+            return
+
+        stash_is_write_header = self.is_write_header
+        self.is_write_header = True
+        try:
+            self._write_header()
+        finally:
+            self.is_write_header = stash_is_write_header
+
     def _get_last_column(self):
         if typepy.is_not_empty_sequence(self.headers):
             return len(self.headers) - 1
@@ -270,6 +373,8 @@ class ExcelXlsTableWriter(ExcelTableWriter):
             - |nan|: written as ``NaN``
     """
 
+    MAX_ROW = 65536
+
     def __init__(self):
         super(ExcelXlsTableWriter, self).__init__()
 
@@ -352,8 +457,33 @@ class ExcelXlsxTableWriter(ExcelTableWriter):
             - |None|: written as an empty string
             - |inf|: written as ``Inf``
             - |nan|: written as ``NaN``
+
+    .. py:attribute:: workbook_options
+
+        Options for ``xlsxwriter.Workbook`` that used when opening a workbook
+        (e.g. ``{"constant_memory": True, "tmpdir": "/path/to/tmp"}``).
+        With ``constant_memory``, each row is flushed to a temporary file
+        as soon as the writer moves to the next row.
+        Rows are written in order, so tables larger than memory can be
+        written by :py:meth:`.write_table_iter` or by setting
+        an iterator to the |value_matrix|.
+        ``"use_zip64": True`` is required for files larger than 4GB.
+        Defaults to |None|.
+
+    .. py:attribute:: column_widths
+
+        A list of column widths (in characters) of the worksheet.
+        Columns that have |None| width are not set.
+        If the value is |None|, widths are calculated from the written data.
+        Declaring widths is recommended when writing a table by chunks,
+        calculated widths only reflect the chunks written so far.
+        Defaults to |None|.
+
+    Styles set by :py:meth:`~.set_conditional_style` are written as cell
+    formats (font weight/style/size and alignment).
     """
 
+    MAX_ROW = 1048576
     MAX_CELL_WIDTH = 60
 
     class TableFormat(object):
@@ -411,11 +541,16 @@ class ExcelXlsxTableWriter(ExcelTableWriter):
             self.TableFormat.NAN: self.Default.NAN_FORMAT,
         }
 
-        self.__col_cell_format_cache = {}
+        self.workbook_options = None
+        self.column_widths = None
+
+        self.__col_cell_writer_cache = {}
         self.__col_numprops_table = {}
+        self.__col_width_table = {}
+        self.__col_width_stream = None
 
     def _open(self, workbook_path):
-        self._workbook = ExcelWorkbookXlsx(workbook_path)
+        self._workbook = ExcelWorkbookXlsx(workbook_path, options=self.workbook_options)
 
     def _write_header(self):
         if not self.is_write_header or typepy.is_empty_sequence(self.headers):
@@ -432,26 +567,74 @@ class ExcelXlsxTableWriter(ExcelTableWriter):
                 row=row, col=0, data=[""] * len(self.headers), cell_format=header_format
             )
 
-    def _write_cell(self, row, col, value_dp):
-        base_props = dict(self.__cell_format_property)
-        format_key = "{:d}_{:s}".format(col, value_dp.typecode.name)
+    def _write_value_matrix(self):
+        # resolve a writer method and a format for each (column, type) once per table,
+        # then write cells with the typed methods of the worksheet
+        get_cell_writer = self.__get_cell_writer
+        conditional_styler_table = self._conditional_styler_table
 
-        if value_dp.typecode in [typepy.Typecode.INTEGER, typepy.Typecode.REAL_NUMBER]:
-            num_props = self.__get_number_property(col)
-            base_props.update(num_props)
-            cell_format = self.__get_cell_format(format_key, base_props)
+        for row_idx, value_dp_list in enumerate(self._table_value_dp_matrix):
+            if self._current_data_row >= self.MAX_ROW:
+                self._rollover_worksheet()
 
-            try:
-                self.stream.write_number(row, col, float(value_dp.data), cell_format)
-                return
-            except TypeError:
-                pass
+            row = self._current_data_row
+
+            for col_idx, value_dp in enumerate(value_dp_list):
+                style = None
+                if col_idx in conditional_styler_table:
+                    style = self.__get_conditional_style(row_idx, col_idx)
+
+                write_cell, cell_format = get_cell_writer(col_idx, value_dp.typecode, style)
+                write_cell(row, col_idx, value_dp.data, cell_format)
 
-        if value_dp.typecode is typepy.Typecode.NAN:
-            base_props = dict(self.__nan_format_property)
+            self._current_data_row += 1
 
-        cell_format = self.__get_cell_format(format_key, base_props)
-        self.stream.write(row, col, value_dp.data, cell_format)
+    def _write_cell(self, row, col, value_dp):
+        write_cell, cell_format = self.__get_cell_writer(col, value_dp.typecode)
+        write_cell(row, col, value_dp.data, cell_format)
+
+    def __get_cell_writer(self, col, typecode, style=None):
+        cell_writer = self.__col_cell_writer_cache.get((col, typecode, style))
+        if cell_writer is not None:
+            return cell_writer
+
+        # cache miss
+        if typecode in [typepy.Typecode.INTEGER, typepy.Typecode.REAL_NUMBER]:
+            write_cell = self.__write_number
+            cell_props = dict(self.__cell_format_property)
+            cell_props.update(self.__get_number_property(col))
+        elif typecode is typepy.Typecode.NAN:
+            write_cell = self.stream.write
+            cell_props = dict(self.__nan_format_property)
+        elif typecode is typepy.Typecode.NONE:
+            write_cell = self.stream.write_blank
+            cell_props = dict(self.__cell_format_property)
+        else:
+            write_cell = self.stream.write
+            cell_props = dict(self.__cell_format_property)
+
+        if style is not None:
+            cell_props.update(_style_to_xlsx_format_property(style))
+
+        cell_writer = (write_cell, self.__add_format(cell_props))
+        self.__col_cell_writer_cache[(col, typecode, style)] = cell_writer
+
+        return cell_writer
+
+    def __get_conditional_style(self, row_idx, col_idx):
+        styler_list, style_idx_list = self._conditional_styler_table[col_idx]
+        style_idx = style_idx_list[row_idx]
+
+        if style_idx is None:
+            return None
+
+        return styler_list[style_idx].style
+
+    def __write_number(self, row, col, value, cell_format):
+        try:
+            self.stream.write_number(row, col, float(value), cell_format)
+        except TypeError:
+            self.stream.write(row, col, value, cell_format)
 
     def __get_number_property(self, col):
         if col in self.__col_numprops_table:
@@ -475,29 +658,34 @@ class ExcelXlsxTableWriter(ExcelTableWriter):
 
         return num_props
 
-    def __get_cell_format(self, format_key, cell_props):
-        cell_format = self.__col_cell_format_cache.get(format_key)
-        if cell_format is not None:
-            return cell_format
-
-        # cache miss
-        cell_format = self.__add_format(cell_props)
-        self.__col_cell_format_cache[format_key] = cell_format
-
-        return cell_format
-
     def __add_format(self, dict_property):
-        return self.workbook.workbook.add_format(dict_property)
+        return self.workbook.add_format(dict_property)
 
     def __set_cell_width(self):
+        if self.column_widths is not None:
+            for col_idx, width in enumerate(self.column_widths):
+                if width is not None:
+                    self.stream.set_column(col_idx, col_idx, width=width)
+            return
+
         font_size = self.__cell_format_property.get("font_size")
 
         if not Integer(font_size).is_type():
             return
 
+        if self.__col_width_stream is not self.stream:
+            # widths are kept per worksheet to widen columns across chunks
+            self.__col_width_table = {}
+            self.__col_width_stream = self.stream
+
         for col_idx, col_dp in enumerate(self._column_dp_list):
             width = min(col_dp.ascii_char_width, self.MAX_CELL_WIDTH) * (font_size / 10.0) + 2
+
+            if width <= self.__col_width_table.get(col_idx, 0):
+                continue
+
             self.stream.set_column(col_idx, col_idx, width=width)
+            self.__col_width_table[col_idx] = width
 
     def _preprocess_table_property(self):
         super(ExcelXlsxTableWriter, self)._preprocess_table_property()
@@ -508,9 +696,17 @@ class ExcelXlsxTableWriter(ExcelTableWriter):
         super(ExcelXlsxTableWriter, self)._postprocess()
 
         self.stream.autofilter(
-            self.last_header_row, self.first_data_col, self.last_data_row, self.last_data_col
+            self.last_header_row,
+            self.first_data_col,
+            min(self.last_data_row, self.MAX_ROW - 1),
+            self.last_data_col,
         )
         self.stream.freeze_panes(self.first_data_row, self.first_data_col)
 
-        self.__col_cell_format_cache = {}
+        self.__col_cell_writer_cache = {}
         self.__col_numprops_table = {}
+
+    def _rollover_worksheet(self):
+        super(ExcelXlsxTableWriter, self)._rollover_worksheet()
+
+        self.__set_cell_width()
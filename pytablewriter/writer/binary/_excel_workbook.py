@@ -107,9 +107,11 @@ class ExcelWorkbookXls(ExcelWorkbook):
 
 
 class ExcelWorkbookXlsx(ExcelWorkbook):
-    def __init__(self, file_path):
+    def __init__(self, file_path, options=None):
         super(ExcelWorkbookXlsx, self).__init__(file_path)
 
+        self.__options = options if options else {}
+        self.__format_table = {}
         self.open(file_path)
 
     def open(self, file_path):
@@ -119,7 +121,13 @@ class ExcelWorkbookXlsx(ExcelWorkbook):
             warnings.warn(import_error_msg_template.format("excel"))
             raise
 
-        self._workbook = xlsxwriter.Workbook(file_path)
+        options = self.__options
+        if hasattr(file_path, "write"):
+            # build the workbook in memory to write to a file object without temporary files
+            options = dict(options)
+            options.setdefault("in_memory", True)
+
+        self._workbook = xlsxwriter.Workbook(file_path, options)
 
     def close(self):
         if self.workbook is None:
@@ -127,6 +135,25 @@ class ExcelWorkbookXlsx(ExcelWorkbook):
 
         self._workbook.close()
         self._clear()
+        self.__format_table = {}
+
+    def add_format(self, format_property):
+        """
+        Return a format of the workbook that has the ``format_property``.
+        Formats are shared by all of the worksheets in the workbook:
+        a format is added to the workbook only once for the same properties.
+        """
+
+        format_key = self.__to_format_key(format_property)
+        cell_format = self.__format_table.get(format_key)
+        if cell_format is not None:
+            return cell_format
+
+        # cache miss
+        cell_format = self.workbook.add_format(format_property)
+        self.__format_table[format_key] = cell_format
+
+        return cell_format
 
     def add_worksheet(self, worksheet_name):
         worksheet_name = sanitize_excel_sheet_name(worksheet_name)
@@ -142,3 +169,10 @@ class ExcelWorkbookXlsx(ExcelWorkbook):
         self._worksheet_table[worksheet_name] = worksheet
 
         return worksheet
+
+    @staticmethod
+    def __to_format_key(format_property):
+        if not format_property:
+            return ()
+
+        return tuple(sorted((key, repr(value)) for key, value in format_property.items()))
@@ -1,6 +1,7 @@
 # encoding: utf-8
 
 import abc
+import io
 
 import six
 
@@ -35,7 +36,18 @@ class AbstractBinaryTableWriter(AbstractTableWriter, BinaryWriterInterface):
         self._stream = None
 
     def dumps(self):
-        raise NotImplementedError("binary format writers did not support dumps method")
+        """
+        Write the table to an in-memory output, instead of a file.
+        If an output is already opened, the output is closed before writing.
+
+        :return: Binary data that written.
+        :rtype: bytes
+        """
+
+        output = io.BytesIO()
+        self.dump(output, close_after_write=True)
+
+        return output.getvalue()
 
     def _verify_stream(self):
         if self.stream is None:
@@ -2,13 +2,99 @@
 
 from __future__ import absolute_import, unicode_literals
 
+import itertools
+import os.path
+import re
+import shutil
+import sqlite3
+import tempfile
+from decimal import Decimal
 from os.path import abspath
 
-import tabledata
+import pathvalidate
+import six
+from typepy import Typecode
 
+from ...error import EmptyTableNameError
+from ...sanitizer import sanitize_headers
 from ._interface import AbstractBinaryTableWriter
 
 
+_RE_PRAGMA_NAME = re.compile(r"^[A-Za-z_]+\Z")
+_RE_PRAGMA_VALUE = re.compile(r"^[A-Za-z0-9_-]+\Z")
+_RE_MULTI_UNDERSCORE = re.compile("_+")
+_MEMORY_DB_PATH = ":memory:"
+_typecode_to_sqlite_type = {
+    Typecode.INTEGER: "INTEGER",
+    Typecode.REAL_NUMBER: "REAL",
+    Typecode.STRING: "TEXT",
+}
+
+
+def _to_database_path(file_path):
+    if file_path == _MEMORY_DB_PATH:
+        return file_path
+
+    return abspath(file_path)
+
+
+def _quote_identifier(name):
+    return '"{:s}"'.format(name.replace('"', '""'))
+
+
+def _sanitize_table_name(table_name):
+    new_name = pathvalidate.sanitize_filename(table_name, replacement_text="_")
+    new_name = pathvalidate.replace_unprintable_char(new_name, replacement_text="")
+    new_name = pathvalidate.replace_symbol(new_name, replacement_text="_")
+    new_name = _RE_MULTI_UNDERSCORE.sub("_", new_name.replace(" ", "_")).strip("_")
+
+    if not new_name:
+        raise EmptyTableNameError("invalid table name: '{}'".format(table_name))
+
+    if new_name.lower().startswith("sqlite_"):
+        # names that start with 'sqlite_' are reserved for internal use
+        return "rename_{:s}".format(new_name)
+
+    return new_name
+
+
+def _to_sqlite_value(value):
+    if value is None or isinstance(
+        value, (six.text_type, six.binary_type, six.integer_types, float)
+    ):
+        return value
+
+    if isinstance(value, Decimal):
+        return float(value)
+
+    return six.text_type(value)
+
+
+def _serialize_sqlite(connection):
+    try:
+        # Python 3.11 or later
+        return connection.serialize()
+    except AttributeError:
+        pass
+
+    tmp_dir_path = tempfile.mkdtemp()
+    try:
+        db_path = os.path.join(tmp_dir_path, "serialize.sqlite3")
+        dst_connection = sqlite3.connect(db_path)
+        try:
+            try:
+                connection.backup(dst_connection)
+            except AttributeError:
+                dst_connection.executescript("\n".join(connection.iterdump()))
+        finally:
+            dst_connection.close()
+
+        with open(db_path, "rb") as f:
+            return f.read()
+    finally:
+        shutil.rmtree(tmp_dir_path)
+
+
 class SqliteTableWriter(AbstractBinaryTableWriter):
     """
     A table writer class for SQLite database.
@@ -25,6 +111,45 @@ class SqliteTableWriter(AbstractBinaryTableWriter):
             If the |value_matrix| is empty.
         :Example:
             :ref:`example-sqlite-table-writer`
+
+    Rows are inserted with ``executemany`` of a prepared ``INSERT`` statement,
+    and committed every ``batch_size`` rows.
+    If an error occurred while writing, the rows of the batch that failed are
+    rolled back (batches committed before the error remain in the table).
+    When a table is written by chunks (:py:meth:`.write_table_iter` or an iterator
+    |value_matrix|), the table is created once from the column types of
+    the first chunk (or |type_hints| if declared), and the following chunks
+    are appended to the table.
+
+    .. py:attribute:: pragmas
+
+        A dictionary of ``PRAGMA`` names and values that applied to the database
+        while writing a table, and restored to the previous values after the write
+        (e.g. ``{"journal_mode": "WAL", "synchronous": "OFF"}`` for faster loading).
+        Defaults to |None|.
+
+    .. py:attribute:: indexes
+
+        A list of indexes to create for the table after all of the rows are
+        written. Each index is specified by one of the following:
+
+        - a column name (|str|)
+        - a list/tuple of column names for a multi-column index
+        - a |dict| that has ``"columns"`` (a column name or a list of column names)
+          and optional ``"unique"`` (|bool|) keys
+
+        Column names can be either the |headers| or the sanitized attribute names.
+        Defaults to |None|.
+
+    .. py:attribute:: is_analyze
+
+        Execute ``ANALYZE`` for the table after writing the table and the indexes
+        if the value is |True|. Defaults to |False|.
+
+    .. py:attribute:: is_vacuum
+
+        Execute ``VACUUM`` for the database after writing the table
+        if the value is |True|. Defaults to |False|.
     """
 
     FORMAT_NAME = "sqlite"
@@ -52,6 +177,15 @@ class SqliteTableWriter(AbstractBinaryTableWriter):
 
         self._quoting_flags = copy.deepcopy(dataproperty.NOT_QUOTING_FLAGS)
 
+        self.pragmas = None
+        self.indexes = None
+        self.is_analyze = False
+        self.is_vacuum = False
+
+        self.__database_path = None
+        self.__output = None
+        self.__clear_table_schema()
+
     def __del__(self):
         self.close()
 
@@ -62,27 +196,68 @@ class SqliteTableWriter(AbstractBinaryTableWriter):
         """
         Open a SQLite database file.
 
-        :param str file_path: SQLite database file path to open.
+        :param file_path:
+            SQLite database file path to open.
+            A binary file object (e.g. :py:class:`io.BytesIO`) is also accepted:
+            the tables are written to an in-memory database, and the database
+            is serialized to the object when closed.
+        :type file_path: str or file object
         """
 
-        from simplesqlite import SimpleSQLite
+        is_file_object = hasattr(file_path, "write")
 
         if self.is_opened():
-            if self.stream.database_path == abspath(file_path):
+            if is_file_object:
+                is_same_output = self.__output is file_path
+            else:
+                is_same_output = self.__output is None and (
+                    self.__database_path == _to_database_path(file_path)
+                )
+
+            if is_same_output:
                 self._logger.logger.debug(
-                    "database already opened: {}".format(self.stream.database_path)
+                    "database already opened: {}".format(self.__database_path)
                 )
                 return
 
             self.close()
 
-        self._stream = SimpleSQLite(file_path, "w")
+        if is_file_object:
+            self.__database_path = _MEMORY_DB_PATH
+            self.__output = file_path
+        else:
+            self.__database_path = _to_database_path(file_path)
+
+        self._logger.logger.debug("open a SQLite database: {}".format(self.__database_path))
+        self._stream = sqlite3.connect(self.__database_path)
+        self.__drop_tables()
+
+    def close(self):
+        """
+        Close the current database.
+        The database is serialized to the output if the output is a file object.
+        """
+
+        if not self.is_opened():
+            return
+
+        self.stream.commit()
+
+        if self.__output is not None:
+            try:
+                self.__output.write(_serialize_sqlite(self.stream))
+            finally:
+                self.__output = None
+
+        super(SqliteTableWriter, self).close()
+        self.__database_path = None
 
     def dump(self, output, close_after_write=True):
         """Write data to the SQLite database file.
 
         Args:
-            output (file descriptor or filepath):
+            output (file object or filepath):
+                Path to the database file to write, or a binary file object.
             close_after_write (bool, optional):
                 Close the output after write.
                 Defaults to |True|.
@@ -95,19 +270,195 @@ class SqliteTableWriter(AbstractBinaryTableWriter):
             if close_after_write:
                 self.close()
 
+    def write_table(self):
+        """
+        |write_table|.
+        An iterator (e.g. a generator) can be set to the |value_matrix|,
+        in that case, rows are appended to the table by ``batch_size`` rows
+        without holding the whole table in memory.
+        """
+
+        with self._logger:
+            self._verify_property()
+
+            if self._is_iterator_value_matrix():
+                self.__write(self._write_table_chunks)
+            else:
+                self.__write(self._write_table)
+
+    def _write_table_iter(self):
+        self._verify_stream()
+        self.__write(super(SqliteTableWriter, self)._write_table_iter)
+
     def _write_table(self):
         self._verify_value_matrix()
-        self._preprocess()
-
-        table_data = tabledata.TableData(
-            self.table_name,
-            self.headers,
-            [
-                [value_dp.data for value_dp in value_dp_list]
-                for value_dp_list in self._table_value_dp_matrix
-            ],
+        self._preprocess_table_dp()
+
+        if self.__insert_query is None:
+            # the table is created from the first chunk of the table:
+            # the following chunks are appended to the table
+            self.__insert_query = self.__create_table()
+
+        records = (
+            [_to_sqlite_value(value_dp.data) for value_dp in value_dp_list]
+            for value_dp_list in self._table_value_dp_matrix
         )
-        self.stream.create_table_from_tabledata(table_data)
+        batch_size = max(self.batch_size, 1)
+        connection = self.stream
+
+        while True:
+            batch_records = list(itertools.islice(records, batch_size))
+            if not batch_records:
+                break
+
+            connection.executemany(self.__insert_query, batch_records)
+            connection.commit()
+
+    def __write(self, write_table):
+        connection = self.stream
+        org_pragmas = self.__apply_pragmas(connection, self.pragmas)
+        self.__clear_table_schema()
+
+        try:
+            write_table()
+            connection.commit()
+            self.__postprocess_table(connection)
+        except BaseException:
+            # rows of the batch that failed are discarded instead of being committed
+            connection.rollback()
+            raise
+        finally:
+            self.__clear_table_schema()
+            self.__apply_pragmas(connection, org_pragmas)
+
+    def __postprocess_table(self, connection):
+        if self.__table_name is None:
+            return
+
+        for attr_names, is_unique in self.__to_index_specs(self.indexes):
+            index_name = "_".join(
+                [self.__table_name] + attr_names + ["unique_index" if is_unique else "index"]
+            )
+            query = "CREATE {:s}INDEX IF NOT EXISTS {:s} ON {:s}({:s})".format(
+                "UNIQUE " if is_unique else "",
+                _quote_identifier(index_name),
+                _quote_identifier(self.__table_name),
+                ", ".join([_quote_identifier(attr_name) for attr_name in attr_names]),
+            )
+            self._logger.logger.debug(query)
+            connection.execute(query)
+
+        connection.commit()
+
+        if self.is_analyze:
+            connection.execute("ANALYZE {:s}".format(_quote_identifier(self.__table_name)))
+            connection.commit()
+
+        if self.is_vacuum:
+            connection.execute("VACUUM")
+
+    def __to_index_specs(self, indexes):
+        if not indexes:
+            return []
+
+        index_specs = []
+
+        for index in indexes:
+            is_unique = False
+
+            if isinstance(index, dict):
+                is_unique = bool(index.get("unique", False))
+                index = index.get("columns")
+
+            if isinstance(index, six.string_types):
+                index = [index]
+
+            if not index:
+                raise ValueError("columns of an index must not be empty")
+
+            index_specs.append(([self.__to_attr_name(column) for column in index], is_unique))
+
+        return index_specs
+
+    def __to_attr_name(self, column):
+        if column in self.__attr_names:
+            return column
+
+        try:
+            return self.__attr_names[list(self.headers).index(column)]
+        except ValueError:
+            raise ValueError(
+                "index column not found in the table: column={}, table={}".format(
+                    column, self.__table_name
+                )
+            )
+
+    def __clear_table_schema(self):
+        self.__table_name = None
+        self.__attr_names = None
+        self.__insert_query = None
+
+    def __create_table(self):
+        table_name = _sanitize_table_name(self.table_name)
+        attr_names = sanitize_headers(self.headers, "sqlite")
+        attr_descs = [
+            "{:s} {:s}".format(
+                _quote_identifier(attr_name), _typecode_to_sqlite_type.get(col_dp.typecode, "TEXT")
+            )
+            for attr_name, col_dp in zip(attr_names, self._column_dp_list)
+        ]
+        query = "CREATE TABLE IF NOT EXISTS {:s} ({:s})".format(
+            _quote_identifier(table_name), ", ".join(attr_descs)
+        )
+        self._logger.logger.debug(query)
+        self.stream.execute(query)
+
+        self.__table_name = table_name
+        self.__attr_names = attr_names
+
+        return "INSERT INTO {:s}({:s}) VALUES ({:s})".format(
+            _quote_identifier(table_name),
+            ", ".join([_quote_identifier(attr_name) for attr_name in attr_names]),
+            ", ".join(["?"] * len(attr_names)),
+        )
+
+    def __drop_tables(self):
+        # the database is opened with write mode: tables already exist are deleted
+        table_names = [
+            table_name
+            for table_name, in self.stream.execute(
+                "SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%'"
+            )
+        ]
+
+        for table_name in table_names:
+            self.stream.execute("DROP TABLE IF EXISTS {:s}".format(_quote_identifier(table_name)))
+
+        self.stream.commit()
+
+    @staticmethod
+    def __apply_pragmas(connection, pragmas):
+        """
+        Apply ``PRAGMA`` values to the connection.
+
+        :return: Previous values of the applied ``PRAGMA``.
+        :rtype: dict
+        """
+
+        if not pragmas:
+            return {}
+
+        pragmas = [(name, six.text_type(value)) for name, value in pragmas.items()]
+        for name, value in pragmas:
+            if not _RE_PRAGMA_NAME.search(name) or not _RE_PRAGMA_VALUE.search(value):
+                raise ValueError("invalid PRAGMA: name={}, value={}".format(name, value))
+
+        org_pragmas = {}
+        for name, value in pragmas:
+            org_pragmas[name] = connection.execute("PRAGMA {:s}".format(name)).fetchone()[0]
+            connection.execute("PRAGMA {:s} = {:s}".format(name, value))
+
+        return org_pragmas
 
     def _write_value_row_separator(self):
         pass
@@ -105,14 +105,21 @@ class HtmlTableWriter(TextTableWriter):
     def _write_body(self):
         tags = _get_tags_module()
         tbody_tag = tags.tbody()
+        style_tag_table = {}
 
-        for value_list, value_dp_list in zip(self._table_value_matrix, self._table_value_dp_matrix):
+        for row_idx, (value_list, value_dp_list) in enumerate(
+            zip(self._table_value_matrix, self._table_value_dp_matrix)
+        ):
             tr_tag = tags.tr()
-            for value, value_dp, styler in zip(value_list, value_dp_list, self._styler_list):
+            for col_idx, (value, value_dp) in enumerate(zip(value_list, value_dp_list)):
                 td_tag = tags.td(MultiByteStrDecoder(value).unicode_str)
                 td_tag["align"] = value_dp.align.align_string
 
-                style_tag = self.__make_style_tag(styler)
+                styler = self._get_cell_styler(row_idx, col_idx)
+                if styler not in style_tag_table:
+                    style_tag_table[styler] = self.__make_style_tag(styler)
+
+                style_tag = style_tag_table[styler]
                 if style_tag:
                     td_tag["style"] = style_tag
 
@@ -128,9 +135,9 @@ class HtmlTableWriter(TextTableWriter):
 
         if styler.font_size:
             styles.append(styler.font_size)
-        if styler._style.font_weight == FontWeight.BOLD:
+        if styler.style.font_weight == FontWeight.BOLD:
             styles.append("font-weight:bold")
-        if styler._style.font_style == FontStyle.ITALIC:
+        if styler.style.font_style == FontStyle.ITALIC:
             styles.append("font-style:italic")
 
         if not styles:
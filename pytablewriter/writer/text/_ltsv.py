@@ -2,10 +2,10 @@
 
 from __future__ import absolute_import, unicode_literals
 
-import pathvalidate
 import typepy
 from six.moves import zip
 
+from ...sanitizer import sanitize_headers
 from ._csv import CsvTableWriter
 
 
@@ -39,7 +39,11 @@ class LtsvTableWriter(CsvTableWriter):
         """
         |write_table| with
         `Labeled Tab-separated Values (LTSV) <http://ltsv.org/>`__ format.
-        Invalid characters in labels/data are removed.
+        Invalid characters in labels/data are removed,
+        and duplicate labels are suffixed with ``_2``, ``_3``, ... .
+        An iterator (e.g. a generator) can be set to the |value_matrix|,
+        in that case, rows are written by :py:attr:`.batch_size` rows
+        without holding the whole table in memory.
 
         :raises pytablewriter.EmptyHeaderError: If the |headers| is empty.
         :Example:
@@ -48,16 +52,34 @@ class LtsvTableWriter(CsvTableWriter):
 
         with self._logger:
             self._verify_property()
-            self._preprocess()
 
-            for value_list in self._table_value_matrix:
-                ltsv_item_list = [
-                    "{:s}:{}".format(pathvalidate.sanitize_ltsv_label(header_name), value)
-                    for header_name, value in zip(self.headers, value_list)
-                    if typepy.is_not_null_string(value)
-                ]
+            if not self._is_iterator_value_matrix():
+                self._write_table()
+                return
 
-                if typepy.is_empty_sequence(ltsv_item_list):
-                    continue
+            self._write_table_chunks()
 
-                self._write_line("\t".join(ltsv_item_list))
+    def _write_table(self):
+        self._preprocess()
+
+        # columns that consist only of null values never be written
+        label_item_list = [
+            (col_dp.column_index, label)
+            for col_dp, label in zip(self._column_dp_list, sanitize_headers(self.headers, "ltsv"))
+            if col_dp.typecode != typepy.Typecode.NONE
+        ]
+        line_list = []
+
+        for value_list in self._table_value_matrix:
+            ltsv_item_list = [
+                "{:s}:{}".format(label, value_list[col_idx])
+                for col_idx, label in label_item_list
+                if value_list[col_idx].strip()
+            ]
+
+            if not ltsv_item_list:
+                continue
+
+            line_list.append("\t".join(ltsv_item_list) + "\n")
+
+        self._write_raw_string("".join(line_list))
@@ -50,9 +50,9 @@ class MarkdownTableWriter(IndentationTextTableWriter):
             super(MarkdownTableWriter, self)._to_header_item(col_dp, value_dp)
         )
 
-    def _to_row_item(self, col_dp, value_dp):
+    def _to_row_item(self, col_dp, value_dp, styler=None):
         return self.__escape_vertical_bar_char(
-            super(MarkdownTableWriter, self)._to_row_item(col_dp, value_dp)
+            super(MarkdownTableWriter, self)._to_row_item(col_dp, value_dp, styler)
         )
 
     def _get_opening_row_item_list(self):
@@ -252,9 +252,9 @@ class TextTableWriter(AbstractTableWriter, TextWriterInterface):
             super(TextTableWriter, self)._to_header_item(col_dp, value_dp)
         )
 
-    def _to_row_item(self, col_dp, value_dp):
+    def _to_row_item(self, col_dp, value_dp, styler=None):
         return self.__value_cell_margin_format.format(
-            super(TextTableWriter, self)._to_row_item(col_dp, value_dp)
+            super(TextTableWriter, self)._to_row_item(col_dp, value_dp, styler)
         )
 
     def _write_raw_string(self, unicode_text):
@@ -2,14 +2,100 @@
 
 from __future__ import absolute_import, unicode_literals
 
+import copy
+import re
+from datetime import datetime
+from decimal import Decimal
+
+import dataproperty
+import six
+from six.moves import zip
+from typepy import Typecode
+
+from ..._converter import to_quoted_str
+from .._table_writer import LineBreakHandling
 from ._text_writer import TextTableWriter
 
 
+_RE_BARE_KEY = re.compile(r"^[A-Za-z0-9_-]+\Z")
+
+
+def _to_toml_key(key):
+    key = six.text_type(key)
+
+    if _RE_BARE_KEY.search(key):
+        return key
+
+    return to_quoted_str(key)
+
+
+def _to_toml_float(value):
+    if value != value:
+        return "nan"
+
+    if value in (float("inf"), float("-inf")):
+        return "inf" if value > 0 else "-inf"
+
+    return six.text_type(value)
+
+
+def _to_toml_datetime(value):
+    return value.isoformat().replace("+00:00", "Z")
+
+
+def _to_toml_value(value):
+    # used for values that are not classified by the writer (e.g. elements of a list)
+    if value is None:
+        return '""'
+
+    if isinstance(value, bool):
+        return "true" if value else "false"
+
+    if isinstance(value, six.integer_types):
+        return six.text_type(value)
+
+    if isinstance(value, (float, Decimal)):
+        return _to_toml_float(value)
+
+    if isinstance(value, datetime):
+        return _to_toml_datetime(value)
+
+    if isinstance(value, dict):
+        return "{{ {} }}".format(
+            ", ".join(
+                "{} = {}".format(_to_toml_key(key), _to_toml_value(item))
+                for key, item in value.items()
+            )
+        )
+
+    if isinstance(value, (list, tuple)):
+        return "[{}]".format(", ".join(_to_toml_value(item) for item in value))
+
+    return to_quoted_str(value)
+
+
+_typecode_to_toml_value = {
+    Typecode.BOOL: lambda value: "true" if value else "false",
+    Typecode.DATETIME: _to_toml_datetime,
+    Typecode.INFINITY: _to_toml_float,
+    Typecode.INTEGER: six.text_type,
+    Typecode.NAN: lambda _value: "nan",
+    Typecode.NULL_STRING: lambda _value: '""',
+    Typecode.REAL_NUMBER: _to_toml_float,
+    Typecode.STRING: to_quoted_str,
+    Typecode.IP_ADDRESS: to_quoted_str,
+}
+
+
 class TomlTableWriter(TextTableWriter):
     """
     A table writer class for
     `TOML <https://github.com/toml-lang/toml>`__ data format.
 
+    Each row is written as a ``[[table_name]]`` block (array of tables)
+    by using the data types detected by the writer.
+    Cells that have |None| values are omitted from the block.
+
         :Example:
             :ref:`example-toml-table-writer`
     """
@@ -28,14 +114,21 @@ class TomlTableWriter(TextTableWriter):
         super(TomlTableWriter, self).__init__()
 
         self.is_formatting_float = False
+        self.line_break_handling = LineBreakHandling.NOP
 
         self._is_require_table_name = True
         self._is_require_header = True
+        self._dp_extractor.type_value_map = {}
+        self._dp_extractor.strip_str_value = None
+        self._quoting_flags = copy.deepcopy(dataproperty.NOT_QUOTING_FLAGS)
 
     def write_table(self):
         """
         |write_table| with
         `TOML <https://github.com/toml-lang/toml>`__ format.
+        An iterator (e.g. a generator) can be set to the |value_matrix|,
+        in that case, rows are written by ``batch_size`` rows
+        without holding the whole table in memory.
 
         :raises pytablewriter.EmptyTableNameError:
             If the |headers| is empty.
@@ -45,8 +138,44 @@ class TomlTableWriter(TextTableWriter):
             :ref:`example-toml-table-writer`
         """
 
-        import toml
-
         with self._logger:
             self._verify_property()
-            self.stream.write(toml.dumps(self.tabledata.as_dict()))
+
+            if not self._is_iterator_value_matrix():
+                self._write_table()
+                return
+
+            self._write_table_chunks()
+
+    def _write_table(self):
+        self._preprocess_table_dp()
+
+        table_header = "[[{:s}]]\n".format(_to_toml_key(self.table_name))
+        key_list = [_to_toml_key(header) for header in self.headers]
+        block_list = []
+
+        for value_dp_list in self._table_value_dp_matrix:
+            item_list = [
+                "{:s} = {:s}\n".format(key, self.__to_toml_value(value_dp))
+                for key, value_dp in zip(key_list, value_dp_list)
+                if value_dp.typecode != Typecode.NONE
+            ]
+
+            if not item_list:
+                continue
+
+            block_list.append(table_header + "".join(item_list) + "\n")
+
+        self._write_raw_string("".join(block_list))
+
+    def _write_value_row_separator(self):
+        pass
+
+    @staticmethod
+    def __to_toml_value(value_dp):
+        to_toml_value = _typecode_to_toml_value.get(value_dp.typecode)
+
+        if to_toml_value is None:
+            return _to_toml_value(value_dp.data)
+
+        return to_toml_value(value_dp.data)
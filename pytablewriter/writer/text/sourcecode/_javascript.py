@@ -2,11 +2,11 @@
 
 from __future__ import absolute_import, unicode_literals
 
-import six
+import typepy
 from dataproperty import DataProperty, DefaultValue
 from typepy import StrictLevel, Typecode
 
-from ...._converter import strip_quote
+from ...._converter import strip_bool_quote
 from ...._function import quote_datetime_formatter
 from ....sanitizer import sanitize_js_var_name
 from .._common import bool_to_str
@@ -88,6 +88,7 @@ class JavaScriptTableWriter(SourceCodeTableWriter):
         super(JavaScriptTableWriter, self).__init__()
 
         self.variable_declaration = "const"
+        self.__pending_row = None
         self._dp_extractor.type_value_map = {
             # Typecode.NONE: "null",
             Typecode.INFINITY: "Infinity",
@@ -105,26 +106,36 @@ class JavaScriptTableWriter(SourceCodeTableWriter):
         else:
             self._dp_extractor.datetime_formatter = quote_datetime_formatter
 
-        org_stream = self.stream
-        self.stream = six.StringIO()
+        self.__pending_row = None
 
         self.inc_indent_level()
         super(JavaScriptTableWriter, self)._write_table()
         self.dec_indent_level()
-        js_matrix_var_def_text = self.stream.getvalue().rstrip("\n")
-        js_matrix_var_def_text = strip_quote(js_matrix_var_def_text, "true")
-        js_matrix_var_def_text = strip_quote(js_matrix_var_def_text, "false")
-        if self.is_write_closing_row:
-            js_matrix_var_def_line_list = js_matrix_var_def_text.splitlines()
-            js_matrix_var_def_line_list[-2] = js_matrix_var_def_line_list[-2].rstrip(",")
-            js_matrix_var_def_text = "\n".join(js_matrix_var_def_line_list)
 
-        self.stream.close()
-        self.stream = org_stream
+    def _write_row(self, value_list):
+        if typepy.is_empty_sequence(value_list):
+            return
 
-        self.dec_indent_level()
-        self._write_line(js_matrix_var_def_text)
-        self.inc_indent_level()
+        # a row is written when the next row comes, to omit the trailing comma
+        # of the last row of an array
+        self.__write_pending_row(is_last_row=False)
+        self.__pending_row = self.char_left_side_row + self.column_delimiter.join(value_list)
+
+    def _write_closing_row(self):
+        self.__write_pending_row(is_last_row=self.is_write_closing_row)
+
+        super(JavaScriptTableWriter, self)._write_closing_row()
+
+    def __write_pending_row(self, is_last_row):
+        if self.__pending_row is None:
+            return
+
+        if is_last_row:
+            self._write_line(self.__pending_row + self.char_right_side_row.rstrip(","))
+        else:
+            self._write_line(self.__pending_row + self.char_right_side_row)
+
+        self.__pending_row = None
 
     def _get_opening_row_item_list(self):
         return ["{:s} {:s} = [".format(self.variable_declaration, self.variable_name)]
@@ -132,8 +143,15 @@ class JavaScriptTableWriter(SourceCodeTableWriter):
     def _get_closing_row_item_list(self):
         return ["];"]
 
-    def _to_row_item(self, col_dp, value_dp):
+    def _to_header_item(self, col_dp, value_dp):
+        return strip_bool_quote(
+            super(JavaScriptTableWriter, self)._to_header_item(col_dp, value_dp)
+        )
+
+    def _to_row_item(self, col_dp, value_dp, styler=None):
         if value_dp.data is None:
             value_dp = self.__NONE_VALUE_DP
 
-        return super(JavaScriptTableWriter, self)._to_row_item(col_dp, value_dp)
+        return strip_bool_quote(
+            super(JavaScriptTableWriter, self)._to_row_item(col_dp, value_dp, styler)
+        )
@@ -2,11 +2,49 @@
 
 from __future__ import absolute_import, unicode_literals
 
+import copy
+import io
+import os.path
+import zipfile
+
+import dataproperty
+import six
 import typepy
+from typepy import Typecode
 
+from ....error import NotSupportedError
+from ..._common import import_error_msg_template
+from ..._table_writer import LineBreakHandling
 from ._python import PythonCodeTableWriter
 
 
+_NUMERIC_TYPECODES = (
+    Typecode.BOOL,
+    Typecode.INFINITY,
+    Typecode.INTEGER,
+    Typecode.NAN,
+    Typecode.NONE,
+    Typecode.NULL_STRING,
+    Typecode.REAL_NUMBER,
+)
+_STR_TYPECODES = (Typecode.IP_ADDRESS, Typecode.NULL_STRING, Typecode.STRING)
+_BINARY_FORMATS = ("npy", "npz")
+
+# integers that can be represented by float64 without loss of precision
+_MAX_FLOAT_INTEGER_BIT_LENGTH = 53
+
+
+def _is_null(value):
+    return value is None or value == ""
+
+
+def _to_naive_utc_datetime(value):
+    if value.tzinfo is None:
+        return value
+
+    return (value - value.utcoffset()).replace(tzinfo=None)
+
+
 class NumpyTableWriter(PythonCodeTableWriter):
     """
     A table writer class for ``NumPy`` source code format.
@@ -14,6 +52,24 @@ class NumpyTableWriter(PythonCodeTableWriter):
         :Example:
             :ref:`example-numpy-table-writer`
 
+    .. py:attribute:: binary_file_path
+
+        Path to a ``.npy``/``.npz`` file.
+        If the value is not |None|, :py:meth:`.write_table` saves the tabular
+        data to the file with :py:meth:`.dump_binary` and writes a variable
+        definition that loads the file instead of a ``numpy.array`` literal.
+        The variable definition includes ``allow_pickle=True`` if the file
+        includes ``object`` arrays.
+        Saving the file requires the ``numpy`` package
+        (``pip install pytablewriter[numpy]``).
+        Defaults to |None|.
+
+    .. py:attribute:: mmap_mode
+
+        ``mmap_mode`` argument for ``numpy.load`` that written to the loader
+        of a ``.npy`` file (e.g. ``"r"`` to memory-map the file).
+        Defaults to |None|.
+
     .. py:method:: write_table
 
         |write_table| with ``NumPy`` format.
@@ -43,14 +99,31 @@ class NumpyTableWriter(PythonCodeTableWriter):
 
     FORMAT_NAME = "numpy"
 
+    # extractor settings for source code while the conversions are disabled
+    __source_code_dp_config = None
+
     @property
     def format_name(self):
         return self.FORMAT_NAME
 
+    @property
+    def line_break_handling(self):
+        if self.__source_code_dp_config is not None:
+            return self.__source_code_dp_config[3]
+
+        return super(NumpyTableWriter, self).line_break_handling
+
+    @line_break_handling.setter
+    def line_break_handling(self, value):
+        self.__set_source_code_conversion(True)
+        super(NumpyTableWriter, type(self)).line_break_handling.fset(self, value)
+
     def __init__(self):
         super(NumpyTableWriter, self).__init__()
 
         self.import_numpy_as = "np"
+        self.binary_file_path = None
+        self.mmap_mode = None
         self._dp_extractor.type_value_map[typepy.Typecode.INFINITY] = "{:s}.inf".format(
             self.import_numpy_as
         )
@@ -58,6 +131,125 @@ class NumpyTableWriter(PythonCodeTableWriter):
             self.import_numpy_as
         )
 
+        self.__is_object_array_dumped = False
+
+    def write_table(self):
+        if not self._is_whole_table_output():
+            super(NumpyTableWriter, self).write_table()
+            return
+
+        with self._logger:
+            self._verify_property()
+            self._write_table()
+
+        if self.is_write_null_line_after_table:
+            self.write_null_line()
+
+    def dump_binary(self, output, file_format=None):
+        """
+        Save the tabular data to the ``output`` as NumPy binary format.
+        Data types of columns are determined by the detected column types.
+
+        - ``"npy"``: a two-dimensional array of the table values.
+          All of the columns must be numeric (integer/real number/bool).
+        - ``"npz"``: one array for each column, named by the header.
+          String and |datetime| columns are also available.
+
+        Integer columns that cannot be represented as ``int64``/``float64``
+        without loss of precision are saved as ``object`` arrays
+        (loading the file requires ``allow_pickle=True``).
+
+        Args:
+            output (str or file object):
+                Path or binary file object of the output file.
+            file_format (str, optional):
+                ``"npy"`` or ``"npz"``.
+                Defaults to the extension of the ``output`` path
+                (``"npy"`` if the format cannot be determined from the ``output``).
+
+        Raises:
+            ImportError:
+                If the ``numpy`` package is not installed
+                (``pip install pytablewriter[numpy]``).
+            ValueError:
+                If the table includes columns that cannot be saved to the format.
+        """
+
+        np = self.__import_numpy()
+        file_format = self.__get_binary_format(output, file_format)
+        array_list = self._to_column_ndarray_list(is_numeric_only=(file_format == "npy"))
+        self.__is_object_array_dumped = any(array.dtype == object for _col_dp, array in array_list)
+
+        try:
+            output.write
+            self.__save_binary(np, output, file_format, array_list)
+        except AttributeError:
+            with open(output, "wb") as f:
+                self.__save_binary(np, f, file_format, array_list)
+
+    def _write_table(self):
+        if self.binary_file_path is None:
+            # enabled before the datetime formatter of the extractor updated for the output
+            self.__set_source_code_conversion(True)
+            super(NumpyTableWriter, self)._write_table()
+            return
+
+        self.dump_binary(self.binary_file_path)
+        self._write_line(
+            "{:s} = {:s}".format(
+                self.variable_name, self._get_binary_loader_text(self.binary_file_path)
+            )
+        )
+
+    def _write_table_iter(self):
+        if self.binary_file_path is not None:
+            raise NotSupportedError("write_table_iter method not supported with binary_file_path")
+
+        super(NumpyTableWriter, self)._write_table_iter()
+
+    def _get_binary_loader_text(self, file_path):
+        arg_list = ['"{:s}"'.format(file_path.replace("\\", "\\\\").replace('"', '\\"'))]
+
+        if self.mmap_mode and self.__get_binary_format(file_path) == "npy":
+            arg_list.append('mmap_mode="{:s}"'.format(self.mmap_mode))
+
+        if self.__is_object_array_dumped:
+            arg_list.append("allow_pickle=True")
+
+        return "{:s}.load({:s})".format(self.import_numpy_as, ", ".join(arg_list))
+
+    def _to_column_data_list(self):
+        # values are extracted without the conversions for source code (quoting, np.nan, etc.)
+        self.__set_source_code_conversion(False)
+        super(NumpyTableWriter, self)._preprocess_table_dp()
+
+        return [
+            (
+                col_dp,
+                [
+                    value_dp_list[col_dp.column_index].data
+                    for value_dp_list in self._table_value_dp_matrix
+                ],
+            )
+            for col_dp in self._column_dp_list
+        ]
+
+    def _preprocess_table_dp(self):
+        self.__set_source_code_conversion(not self._is_whole_table_output())
+
+        super(NumpyTableWriter, self)._preprocess_table_dp()
+
+    def _to_column_ndarray_list(self, is_numeric_only=False):
+        np = self.__import_numpy()
+
+        return [
+            (col_dp, self.__to_ndarray(np, col_dp, data_list, is_numeric_only))
+            for col_dp, data_list in self._to_column_data_list()
+        ]
+
+    def _is_whole_table_output(self):
+        return self.binary_file_path is not None
+
     def _get_opening_row_item_list(self):
         array_def = "{:s}.array([".format(self.import_numpy_as)
 
@@ -68,3 +260,142 @@ class NumpyTableWriter(PythonCodeTableWriter):
 
     def _get_closing_row_item_list(self):
         return ["])"]
+
+    def __set_source_code_conversion(self, is_enabled):
+        """
+        Switch the conversions of the data property extractor for source code.
+        Extracted table data are cleared when the conversions switched,
+        so the table data are extracted once for each of the output types.
+        """
+
+        is_raw = self.__source_code_dp_config is not None
+        if is_raw != is_enabled:
+            return
+
+        dp_extractor = self._dp_extractor
+
+        if is_enabled:
+            (
+                dp_extractor.type_value_map,
+                dp_extractor.quoting_flags,
+                dp_extractor.datetime_formatter,
+                dp_extractor.line_break_handling,
+            ) = self.__source_code_dp_config
+            self.__source_code_dp_config = None
+        else:
+            self.__source_code_dp_config = (
+                dp_extractor.type_value_map,
+                dp_extractor.quoting_flags,
+                dp_extractor.datetime_formatter,
+                dp_extractor.line_break_handling,
+            )
+            dp_extractor.type_value_map = copy.deepcopy(dataproperty.DefaultValue.TYPE_VALUE_MAP)
+            dp_extractor.quoting_flags = copy.deepcopy(dataproperty.NOT_QUOTING_FLAGS)
+            dp_extractor.datetime_formatter = None
+            dp_extractor.line_break_handling = LineBreakHandling.NOP
+
+        self._clear_preprocess()
+
+    def __save_binary(self, np, f, file_format, array_list):
+        if file_format == "npy":
+            if array_list:
+                np.save(f, np.column_stack([array for _col_dp, array in array_list]))
+            else:
+                np.save(f, np.empty((0, 0)))
+            return
+
+        # same layout as numpy.savez: arrays are not passed as keyword arguments
+        # to accept arbitrary header names as array names
+        with zipfile.ZipFile(f, mode="w", compression=zipfile.ZIP_STORED, allowZip64=True) as zf:
+            for col_dp, array in array_list:
+                buffer = io.BytesIO()
+                np.lib.format.write_array(buffer, array, allow_pickle=(array.dtype == object))
+                zf.writestr(self.__get_array_name(col_dp) + ".npy", buffer.getvalue())
+
+    def __get_array_name(self, col_dp):
+        try:
+            return six.text_type(self.headers[col_dp.column_index])
+        except (IndexError, TypeError):
+            return "arr_{:d}".format(col_dp.column_index)
+
+    @staticmethod
+    def __to_ndarray(np, col_dp, data_list, is_numeric_only):
+        typecode = col_dp.typecode
+        has_null = any(_is_null(data) for data in data_list)
+
+        if typecode == Typecode.INTEGER and not has_null and col_dp.bit_length < 64:
+            return np.array([int(data) for data in data_list], dtype=np.int64)
+
+        if typecode == Typecode.INTEGER and (
+            col_dp.bit_length >= 64
+            or (has_null and col_dp.bit_length > _MAX_FLOAT_INTEGER_BIT_LENGTH)
+        ):
+            # cannot be represented as int64/float64 without loss of precision
+            return np.array(
+                [None if _is_null(data) else int(data) for data in data_list], dtype=object
+            )
+
+        if typecode == Typecode.BOOL and not has_null:
+            return np.array(data_list, dtype=np.bool_)
+
+        if typecode in _NUMERIC_TYPECODES:
+            return np.array(
+                [np.nan if _is_null(data) else float(data) for data in data_list], dtype=np.float64
+            )
+
+        if is_numeric_only:
+            raise ValueError(
+                "npy format only supports numeric columns: column={}, type={}".format(
+                    col_dp.column_index, col_dp.typename
+                )
+            )
+
+        if typecode == Typecode.DATETIME:
+            return np.array(
+                [
+                    np.datetime64("NaT")
+                    if _is_null(data)
+                    else np.datetime64(_to_naive_utc_datetime(data), "us")
+                    for data in data_list
+                ],
+                dtype="datetime64[us]",
+            )
+
+        if typecode in _STR_TYPECODES:
+            return np.array(
+                ["" if data is None else six.text_type(data) for data in data_list], dtype="U"
+            )
+
+        raise ValueError(
+            "unsupported column type for binary format: column={}, type={}".format(
+                col_dp.column_index, col_dp.typename
+            )
+        )
+
+    @staticmethod
+    def __get_binary_format(output, file_format=None):
+        if file_format is None:
+            try:
+                file_format = os.path.splitext(output)[1].lstrip(".")
+            except (AttributeError, TypeError):
+                file_format = ""
+
+            if file_format.lower() not in _BINARY_FORMATS:
+                file_format = "npy"
+
+        file_format = file_format.lower()
+        if file_format not in _BINARY_FORMATS:
+            raise ValueError(
+                "file_format must be one of {}: actual={}".format(_BINARY_FORMATS, file_format)
+            )
+
+        return file_format
+
+    @staticmethod
+    def __import_numpy():
+        try:
+            import numpy as np
+        except ImportError as e:
+            six.raise_from(ImportError(import_error_msg_template.format("numpy")), e)
+
+        return np
@@ -2,11 +2,21 @@
 
 from __future__ import absolute_import, unicode_literals
 
+from decimal import Decimal
+
+import six
 import typepy
 from mbstrdecoder import MultiByteStrDecoder
+from typepy import Typecode
+
+from ...._converter import to_quoted_str
+from ....error import EmptyTableNameError, NotSupportedError
+from ._numpy import NumpyTableWriter, _is_null
+
 
-from ....error import EmptyTableNameError
-from ._numpy import NumpyTableWriter
+def _to_str_literal(value):
+    # \xXX escapes are valid in both str and unicode literals of Python 2/3
+    return to_quoted_str(value, control_char_template="\\x{:02x}")
 
 
 class PandasDataFrameWriter(NumpyTableWriter):
@@ -24,6 +34,22 @@ class PandasDataFrameWriter(NumpyTableWriter):
 
         Specify ``numpy`` module import name. Defaults to ``"np"``.
 
+    .. py:attribute:: is_columnar_output
+
+        Write the tabular data as a column-oriented ``pandas.DataFrame``
+        definition (a dictionary of arrays) if the value is |True|.
+        Each column is written as an array with an explicit ``dtype`` that
+        determined by the column type detected by the writer:
+
+        - integer: ``int64`` (nullable ``Int64`` if the column includes |None|)
+        - bool: ``bool`` (nullable ``boolean`` if the column includes |None|)
+        - real number/|inf|/|nan|: ``float64``
+        - |datetime|: ``datetime64[us]`` (``pandas.to_datetime`` with UTC
+          if the column includes timezone-aware values)
+        - others: ``object``
+
+        Defaults to |False|.
+
     .. py:method:: write_table
 
         |write_table| with Pandas DataFrame format.
@@ -62,27 +88,155 @@ class PandasDataFrameWriter(NumpyTableWriter):
         self.table_name = ""
         self.import_pandas_as = "pd"
         self.is_write_header = False
+        self.is_columnar_output = False
+
+    def _write_table(self):
+        if self.binary_file_path is not None or not self.is_columnar_output:
+            super(PandasDataFrameWriter, self)._write_table()
+            return
+
+        self._write_line("{} = {}.DataFrame({{".format(self.variable_name, self.import_pandas_as))
+        self.inc_indent_level()
+
+        for col_dp, data_list in self._to_column_data_list():
+            self._write_line(
+                "{}: {},".format(
+                    self.__get_column_key(col_dp.column_index),
+                    self.__to_column_array_text(col_dp, data_list),
+                )
+            )
+
+        self.dec_indent_level()
+        self._write_line("})")
+
+    def _write_table_iter(self):
+        if self.is_columnar_output:
+            raise NotSupportedError("write_table_iter method not supported with columnar output")
+
+        super(PandasDataFrameWriter, self)._write_table_iter()
+
+    def _is_whole_table_output(self):
+        return (
+            super(PandasDataFrameWriter, self)._is_whole_table_output() or self.is_columnar_output
+        )
 
     def _get_opening_row_item_list(self):
         return ["{} = {}.DataFrame([".format(self.variable_name, self.import_pandas_as)]
 
     def _get_closing_row_item_list(self):
         if typepy.is_not_empty_sequence(self.headers):
-            return [
-                "], columns=[{}])".format(
-                    ", ".join(
-                        [
-                            '"{}"'.format(MultiByteStrDecoder(header).unicode_str)
-                            for header in self.headers
-                        ]
-                    )
-                )
-            ]
+            return ["], columns=[{}])".format(self.__get_columns_text())]
 
         return ["])"]
 
+    def _get_binary_loader_text(self, file_path):
+        loader_text = super(PandasDataFrameWriter, self)._get_binary_loader_text(file_path)
+
+        if file_path.lower().endswith(".npz"):
+            loader_text = "dict({})".format(loader_text)
+
+        if typepy.is_not_empty_sequence(self.headers):
+            return "{}.DataFrame({}, columns=[{}])".format(
+                self.import_pandas_as, loader_text, self.__get_columns_text()
+            )
+
+        return "{}.DataFrame({})".format(self.import_pandas_as, loader_text)
+
     def _verify_property(self):
         super(PandasDataFrameWriter, self)._verify_property()
 
         if typepy.is_null_string(self.table_name):
             raise EmptyTableNameError("table_name must be a string of one or more characters")
+
+    def __get_column_key(self, column_index):
+        try:
+            return _to_str_literal(MultiByteStrDecoder(self.headers[column_index]).unicode_str)
+        except (IndexError, TypeError):
+            return six.text_type(column_index)
+
+    def __to_column_array_text(self, col_dp, data_list):
+        typecode = col_dp.typecode
+        has_null = any(_is_null(data) for data in data_list)
+        np_array_template = self.import_numpy_as + '.array([{}], dtype="{}")'
+        pd_array_template = self.import_pandas_as + '.array([{}], dtype="{}")'
+
+        if typecode == Typecode.INTEGER and col_dp.bit_length < 64:
+            item_list = [
+                "None" if _is_null(data) else six.text_type(int(data)) for data in data_list
+            ]
+
+            if has_null:
+                return pd_array_template.format(", ".join(item_list), "Int64")
+
+            return np_array_template.format(", ".join(item_list), "int64")
+
+        if typecode == Typecode.BOOL:
+            item_list = [
+                "None" if _is_null(data) else six.text_type(bool(data)) for data in data_list
+            ]
+
+            if has_null:
+                return pd_array_template.format(", ".join(item_list), "boolean")
+
+            return np_array_template.format(", ".join(item_list), "bool")
+
+        if typecode in (Typecode.REAL_NUMBER, Typecode.INFINITY, Typecode.NAN):
+            return np_array_template.format(
+                ", ".join(self.__to_float_literal(data) for data in data_list), "float64"
+            )
+
+        if typecode == Typecode.DATETIME:
+            if any(not _is_null(data) and data.tzinfo is not None for data in data_list):
+                return "{}.to_datetime([{}], utc=True)".format(
+                    self.import_pandas_as,
+                    ", ".join(
+                        "None" if _is_null(data) else _to_str_literal(data.isoformat())
+                        for data in data_list
+                    ),
+                )
+
+            return np_array_template.format(
+                ", ".join(
+                    _to_str_literal("NaT" if _is_null(data) else data.isoformat())
+                    for data in data_list
+                ),
+                "datetime64[us]",
+            )
+
+        return "{}.array([{}], dtype=object)".format(
+            self.import_numpy_as,
+            ", ".join(
+                "None" if data is None else self.__to_object_literal(data) for data in data_list
+            ),
+        )
+
+    def __to_float_literal(self, value):
+        if _is_null(value):
+            return "{}.nan".format(self.import_numpy_as)
+
+        value = float(value)
+
+        if value != value:
+            return "{}.nan".format(self.import_numpy_as)
+
+        if value in (float("inf"), float("-inf")):
+            return "{}{}.inf".format("" if value > 0 else "-", self.import_numpy_as)
+
+        return repr(value)
+
+    def __to_object_literal(self, value):
+        if isinstance(value, bool):
+            return six.text_type(value)
+
+        if isinstance(value, six.integer_types):
+            return six.text_type(value)
+
+        if isinstance(value, (float, Decimal)):
+            return self.__to_float_literal(value)
+
+        return _to_str_literal(value)
+
+    def __get_columns_text(self):
+        return ", ".join(
+            ['"{}"'.format(MultiByteStrDecoder(header).unicode_str) for header in self.headers]
+        )
@@ -54,6 +54,25 @@ class SourceCodeTableWriter(IndentationTextTableWriter):
         self._quoting_flags[typepy.Typecode.DATETIME] = False
         self._is_require_table_name = True
 
+    def write_table(self):
+        """
+        |write_table|.
+        An iterator (e.g. a generator) can be set to the |value_matrix|,
+        in that case, rows are written by ``batch_size`` rows
+        without holding the whole table in memory.
+        """
+
+        if not self._is_iterator_value_matrix():
+            super(SourceCodeTableWriter, self).write_table()
+            return
+
+        with self._logger:
+            self._verify_property()
+            self._write_table_chunks()
+
+        if self.is_write_null_line_after_table:
+            self.write_null_line()
+
     def _get_value_row_separator_item_list(self):
         return []
 
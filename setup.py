@@ -60,8 +60,7 @@ es6_requires = ["elasticsearch>=6.2.0,<7.0.0"]
 from_requires = ["pytablereader>=0.24.1,<1.0.0"]
 html_requires = ["dominate>=2.3.5,<3.0.0"]
 logging_requires = ["Logbook>=1.1.0,<2.0.0"]
-sqlite_requires = ["SimpleSQLite>=0.39.0,<1.0.0"]
-toml_requires = ["toml>=0.9.4,<1.0.0"]
+numpy_requires = ["numpy>=1.10.0"]
 optional_requires = ["simplejson>=3.16,<4.0"]
 all_requires = (
     excel_requires
@@ -69,8 +68,7 @@ all_requires = (
     + from_requires
     + html_requires
     + logging_requires
-    + sqlite_requires
-    + toml_requires
+    + numpy_requires
     + optional_requires
 )
 tests_requires = frozenset(tests_requires + all_requires)
@@ -111,10 +109,11 @@ setuptools.setup(
         "html": html_requires,
         "from": from_requires,
         "logging": logging_requires,
+        "numpy": numpy_requires,
         "release": ["releasecmd>=0.0.18,<0.1.0"],
-        "sqlite": sqlite_requires,
+        "sqlite": [],  # no longer required: kept for backward compatibility
         "test": tests_requires,
-        "toml": toml_requires,
+        "toml": [],  # no longer required: kept for backward compatibility
     },
 
     classifiers=[
@@ -0,0 +1,78 @@
+# encoding: utf-8
+
+from __future__ import absolute_import, unicode_literals
+
+import threading
+
+import pytest
+from pytablewriter.sanitizer._cache import lru_cache
+
+
+class Test_lru_cache(object):
+    def test_normal(self):
+        call_list = []
+
+        @lru_cache(maxsize=2)
+        def upper(value, suffix=""):
+            call_list.append(value)
+            return value.upper() + suffix
+
+        assert upper("a") == "A"
+        assert upper("a") == "A"
+        assert upper("a", suffix="_") == "A_"
+        assert call_list == ["a", "a"]
+
+        # "b" evicts the least recently used entry: ("a", suffix="_")
+        assert upper("a") == "A"
+        assert upper("b") == "B"
+        assert upper("a") == "A"
+        assert upper("a", suffix="_") == "A_"
+        assert call_list == ["a", "a", "b", "a"]
+
+        upper.cache_clear()
+        assert upper("b") == "B"
+        assert call_list == ["a", "a", "b", "a", "b"]
+
+    def test_normal_unhashable(self):
+        @lru_cache()
+        def join(value):
+            return "".join(value)
+
+        assert join(["a", "b"]) == "ab"
+        assert join(["a", "b"]) == "ab"
+
+    def test_normal_thread(self):
+        @lru_cache(maxsize=8)
+        def square(value):
+            return value * value
+
+        error_list = []
+
+        def run():
+            try:
+                for i in range(1000):
+                    assert square(i % 16) == (i % 16) ** 2
+            except Exception as e:
+                error_list.append(e)
+
+        thread_list = [threading.Thread(target=run) for _i in range(8)]
+        for thread in thread_list:
+            thread.start()
+        for thread in thread_list:
+            thread.join()
+
+        assert error_list == []
+
+    def test_exception(self):
+        call_list = []
+
+        @lru_cache()
+        def validate(value):
+            call_list.append(value)
+            raise ValueError(value)
+
+        for _i in range(2):
+            with pytest.raises(ValueError):
+                validate("a")
+
+        assert call_list == ["a", "a"]
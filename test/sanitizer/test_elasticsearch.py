@@ -9,7 +9,7 @@ from __future__ import absolute_import, unicode_literals
 import itertools
 
 import pytest
-from pytablewriter.sanitizer import ElasticsearchIndexNameSanitizer
+from pytablewriter.sanitizer import ElasticsearchIndexNameSanitizer, sanitize_es_index_name
 
 
 INVALID_ES_CHARS = ["\\", "," "*", "?", '"', "<", ">", "|", " "]
@@ -68,3 +68,18 @@ class Test_ElasticsearchIndexNameSanitizer(object):
     def test_exception_type(self, value, expected):
         with pytest.raises(expected):
             ElasticsearchIndexNameSanitizer(value).validate()
+
+
+class Test_sanitize_es_index_name(object):
+    @pytest.mark.parametrize(
+        ["value", "replace_text", "expected"],
+        [["A B", "_", "A_B"], ["__A*B", "", "AB"], ["A|B", "_", "A_B"]],
+    )
+    def test_normal(self, value, replace_text, expected):
+        assert sanitize_es_index_name(value, replace_text) == expected
+        assert sanitize_es_index_name(value, replace_text) == expected
+
+    @pytest.mark.parametrize(["value", "expected"], [[None, ValueError], ["", ValueError]])
+    def test_exception(self, value, expected):
+        with pytest.raises(expected):
+            sanitize_es_index_name(value)
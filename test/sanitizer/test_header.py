@@ -0,0 +1,48 @@
+# encoding: utf-8
+
+from __future__ import absolute_import, unicode_literals
+
+import pytest
+from pytablewriter.sanitizer import sanitize_headers
+from pytablewriter.sanitizer._header import _sanitize_headers
+
+
+class Test_sanitize_headers(object):
+    @pytest.mark.parametrize(
+        ["headers", "target", "expected"],
+        [
+            [["a", "b", "a", "a"], "python", ["a", "b", "a_2", "a_3"]],
+            [["a", "a_2", "a"], "python", ["a", "a_2", "a_3"]],
+            [["a b", "a-b", "1a"], "python", ["a_b", "a_b_2", "a"]],
+            [["a", "", None], "python", ["a", "B", "C"]],
+            [["a", "A", "b"], "sqlite", ["a", "A_2", "b"]],
+            [["a,b", "a'b", "あ"], "sqlite", ["a_b", "a_b_2", "あ"]],
+            [["a", "A", "b"], "ltsv", ["a", "A", "b"]],
+            [["a:b", "a\tb"], "ltsv", ["ab", "ab_2"]],
+            [["a.b", "a_b", "_c"], "elasticsearch", ["a.b", "a_b", "_c"]],
+            [["a.b", "a.b", ""], "elasticsearch", ["a.b", "a.b_2", "C"]],
+            [["a b", "a-b"], "javascript", ["a_b", "a_b_2"]],
+            [[], "python", []],
+            [None, "python", []],
+        ],
+    )
+    def test_normal(self, headers, target, expected):
+        assert sanitize_headers(headers, target) == expected
+
+    def test_normal_cache(self):
+        _sanitize_headers.cache_clear()
+
+        headers = ["a", "a", "b"]
+        result = sanitize_headers(headers, "python")
+        result.append("c")
+
+        assert sanitize_headers(tuple(headers), "python") == ["a", "a_2", "b"]
+        assert sanitize_headers(headers, "python") is not result
+
+    @pytest.mark.parametrize(
+        ["headers", "target", "expected"],
+        [[["a"], "unknown", ValueError], [["a"], None, ValueError]],
+    )
+    def test_exception(self, headers, target, expected):
+        with pytest.raises(expected):
+            sanitize_headers(headers, target)
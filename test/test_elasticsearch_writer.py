@@ -9,6 +9,7 @@ from __future__ import absolute_import, print_function, unicode_literals
 import collections
 import datetime
 import platform  # noqa: W0611
+import threading
 from decimal import Decimal
 
 import pytablewriter as ptw
@@ -176,6 +177,108 @@ class Test_ElasticsearchWriter__get_mappings(object):
         assert body == expected_body
 
 
+class IndexExistsError(Exception):
+    # same attributes as elasticsearch.TransportError
+    status_code = 400
+    error = "resource_already_exists_exception"
+
+
+class IndicesClient(object):
+    def __init__(self, call_list, settings=None, is_index_exists=False):
+        self.__call_list = call_list
+        self.__settings = settings or {}
+        self.__is_index_exists = is_index_exists
+
+    def create(self, index, body):
+        self.__call_list.append(("create", index, body))
+
+        if self.__is_index_exists:
+            raise IndexExistsError()
+
+    def get_settings(self, index):
+        self.__call_list.append(("get_settings", index, None))
+        return {index: {"settings": {"index": self.__settings}}}
+
+    def put_settings(self, index, body):
+        self.__call_list.append(("put_settings", index, body))
+
+    def refresh(self, index):
+        self.__call_list.append(("refresh", index, None))
+
+    def forcemerge(self, index, max_num_segments):
+        self.__call_list.append(("forcemerge", index, max_num_segments))
+
+
+class LocalClient(object):
+    """
+    Elasticsearch client that records API calls instead of sending requests.
+    """
+
+    def __init__(
+        self, error_doc_idx_list=None, reject_count=0, settings=None, is_index_exists=False
+    ):
+        self.call_list = []
+        self.request_list = []
+        self.indices = IndicesClient(self.call_list, settings, is_index_exists)
+        self.__error_doc_idx_list = error_doc_idx_list or []
+        self.__reject_count = reject_count
+        self.__reject_count_table = collections.Counter()
+        self.__doc_count = 0
+        self.__lock = threading.Lock()
+
+    @property
+    def doc_list(self):
+        return [doc for request in self.request_list for doc in request["docs"]]
+
+    def bulk(self, body, index=None, doc_type=None):
+        with self.__lock:
+            return self.__bulk(body, index, doc_type)
+
+    def __bulk(self, body, index, doc_type):
+        line_list = body.splitlines()
+        doc_list = [json.loads(line) for line in line_list[1::2]]
+        self.request_list.append(
+            {"index": index, "doc_type": doc_type, "actions": line_list[::2], "docs": doc_list}
+        )
+        self.call_list.append(("bulk", index, len(doc_list)))
+
+        item_list = []
+        for doc_line in line_list[1::2]:
+            if self.__reject_count_table[doc_line] < self.__reject_count:
+                self.__reject_count_table[doc_line] += 1
+                item_list.append(
+                    {"index": {"status": 429, "error": {"type": "es_rejected_execution_exception"}}}
+                )
+                continue
+
+            if self.__doc_count in self.__error_doc_idx_list:
+                item_list.append(
+                    {
+                        "index": {
+                            "status": 400,
+                            "error": {"type": "mapper_parsing_exception", "reason": "failed"},
+                        }
+                    }
+                )
+            else:
+                item_list.append({"index": {"status": 201, "result": "created"}})
+
+            self.__doc_count += 1
+
+        return {"errors": any("error" in item["index"] for item in item_list), "items": item_list}
+
+
+def make_writer(client, value_matrix, headers=("i",), index_name="bulk"):
+    writer = table_writer_class()
+    writer.stream = client
+    writer.index_name = index_name
+    writer.headers = list(headers)
+    writer.value_matrix = value_matrix
+    writer.bulk_initial_backoff = 0
+
+    return writer
+
+
 class Test_ElasticsearchWriter_write_table(object):
     @pytest.mark.parametrize(
         ["table", "header", "value", "expected"],
@@ -192,3 +295,353 @@ class Test_ElasticsearchWriter_write_table(object):
 
         with pytest.raises(expected):
             writer.write_table()
+
+    @pytest.mark.parametrize(["stream"], [[object()], [threading.Lock()]])
+    def test_exception_stream(self, stream):
+        writer = make_writer(stream, [[1]])
+
+        with pytest.raises(ValueError):
+            writer.write_table()
+
+    def test_normal_index_exists(self):
+        writer = make_writer(LocalClient(is_index_exists=True), [[1], [2]])
+        writer.write_table()
+
+        assert [call[0] for call in writer.stream.call_list] == ["create", "bulk"]
+        assert writer.stream.doc_list == [{"i": 1}, {"i": 2}]
+
+
+class Test_ElasticsearchWriter_write_table_bulk(object):
+    @pytest.mark.parametrize(
+        ["bulk_chunk_size", "bulk_max_chunk_bytes", "expected"],
+        [[500, 100 * 1024 * 1024, [5]], [2, 100 * 1024 * 1024, [2, 2, 1]], [500, 100, [2, 2, 1]]],
+    )
+    def test_normal_chunk(self, bulk_chunk_size, bulk_max_chunk_bytes, expected):
+        writer = make_writer(
+            LocalClient(),
+            [[i, i + 0.5, "value {}".format(i)] for i in range(5)],
+            headers=["i", "f", "s"],
+        )
+        writer.bulk_chunk_size = bulk_chunk_size
+        writer.bulk_max_chunk_bytes = bulk_max_chunk_bytes
+        writer.write_table()
+
+        request_list = writer.stream.request_list
+        assert [len(request["docs"]) for request in request_list] == expected
+        assert request_list[0]["index"] == "bulk"
+        assert request_list[0]["doc_type"] == "table"
+        assert [json.loads(action) for action in request_list[0]["actions"]] == [
+            {"index": {}}
+        ] * len(request_list[0]["docs"])
+        assert writer.stream.doc_list == [
+            {"i": i, "f": i + 0.5, "s": "value {}".format(i)} for i in range(5)
+        ]
+
+    def test_normal_error(self):
+        writer = make_writer(LocalClient(error_doc_idx_list=[1, 3]), [[i] for i in range(5)])
+        writer.bulk_chunk_size = 2
+
+        # failed documents are logged without raising by default
+        writer.write_table()
+
+        assert len(writer.stream.request_list) == 3
+        assert writer.stream.doc_list == [{"i": i} for i in range(5)]
+
+    def test_exception_error(self):
+        writer = make_writer(LocalClient(error_doc_idx_list=[1, 3]), [[i] for i in range(5)])
+        writer.bulk_chunk_size = 2
+        writer.is_raise_on_bulk_error = True
+
+        with pytest.raises(ptw.BulkIndexError) as e:
+            writer.write_table()
+
+        # errors raised after all of the chunks sent
+        assert len(writer.stream.request_list) == 3
+        assert e.value.success_count == 3
+        assert e.value.failed_count == 2
+        assert [json.loads(error["body"]) for error in e.value.error_list] == [{"i": 1}, {"i": 3}]
+        assert {error["status"] for error in e.value.error_list} == {400}
+
+    @pytest.mark.parametrize(
+        ["reject_count", "max_retries", "expected_request_count"], [[0, 3, 2], [2, 3, 6]]
+    )
+    def test_normal_retry(self, reject_count, max_retries, expected_request_count):
+        writer = make_writer(LocalClient(reject_count=reject_count), [[i] for i in range(4)])
+        writer.bulk_chunk_size = 2
+        writer.bulk_max_retries = max_retries
+        writer.write_table()
+
+        assert len(writer.stream.request_list) == expected_request_count
+        assert sorted(doc["i"] for doc in writer.stream.doc_list) == sorted(
+            list(range(4)) * (reject_count + 1)
+        )
+
+    def test_exception_retry(self):
+        writer = make_writer(LocalClient(reject_count=3), [[i] for i in range(4)])
+        writer.bulk_chunk_size = 2
+        writer.bulk_max_retries = 2
+        writer.is_raise_on_bulk_error = True
+
+        with pytest.raises(ptw.BulkIndexError) as e:
+            writer.write_table()
+
+        assert len(writer.stream.request_list) == 6
+        assert e.value.success_count == 0
+        assert {error["status"] for error in e.value.error_list} == {429}
+        assert len(e.value.error_list) == 4
+
+    def test_normal_retry_request(self):
+        class TransportError(Exception):
+            status_code = 503
+
+        class RejectClient(LocalClient):
+            def __init__(self):
+                super(RejectClient, self).__init__()
+                self.reject_count = 0
+
+            def bulk(self, body, index=None, doc_type=None):
+                if self.reject_count < 2:
+                    self.reject_count += 1
+                    raise TransportError()
+
+                return super(RejectClient, self).bulk(body, index, doc_type)
+
+        writer = make_writer(RejectClient(), [[i] for i in range(4)])
+        writer.write_table()
+
+        assert writer.stream.doc_list == [{"i": i} for i in range(4)]
+
+        writer.stream = RejectClient()
+        writer.bulk_max_retries = 1
+        with pytest.raises(TransportError):
+            writer.write_table()
+
+    @pytest.mark.parametrize(["thread_count"], [[1], [2], [8]])
+    def test_normal_parallel(self, thread_count):
+        writer = make_writer(LocalClient(reject_count=1), [[i] for i in range(100)])
+        writer.bulk_chunk_size = 7
+        writer.bulk_thread_count = thread_count
+        writer.write_table()
+
+        assert sorted(doc["i"] for doc in writer.stream.doc_list) == sorted(list(range(100)) * 2)
+
+    @pytest.mark.parametrize(["thread_count"], [[1], [4]])
+    def test_exception_parallel_error(self, thread_count):
+        writer = make_writer(LocalClient(error_doc_idx_list=[10]), [[i] for i in range(100)])
+        writer.bulk_chunk_size = 7
+        writer.bulk_thread_count = thread_count
+        writer.is_raise_on_bulk_error = True
+
+        with pytest.raises(ptw.BulkIndexError) as e:
+            writer.write_table()
+
+        assert e.value.success_count == 99
+        assert e.value.failed_count == 1
+        assert len(e.value.error_list) == 1
+
+    @pytest.mark.parametrize(["thread_count"], [[1], [4]])
+    def test_exception_error_sample(self, thread_count):
+        writer = make_writer(
+            LocalClient(error_doc_idx_list=list(range(0, 100, 2))), [[i] for i in range(100)]
+        )
+        writer.bulk_chunk_size = 7
+        writer.bulk_thread_count = thread_count
+        writer.is_raise_on_bulk_error = True
+
+        with pytest.raises(ptw.BulkIndexError) as e:
+            writer.write_table()
+
+        # only a few samples of the failed documents are kept
+        assert e.value.success_count == 50
+        assert e.value.failed_count == 50
+        assert len(e.value.error_list) == 5
+        assert {error["status"] for error in e.value.error_list} == {400}
+
+    def test_exception_parallel(self):
+        class ErrorClient(LocalClient):
+            def bulk(self, body, index=None, doc_type=None):
+                raise RuntimeError("bulk error")
+
+        writer = make_writer(ErrorClient(), [[i] for i in range(100)])
+        writer.bulk_chunk_size = 3
+        writer.bulk_thread_count = 4
+
+        with pytest.raises(RuntimeError):
+            writer.write_table()
+
+
+class Test_ElasticsearchWriter_write_table_index_settings(object):
+    @pytest.mark.parametrize(
+        ["index_settings", "is_bulk_load_tuning", "expected"],
+        [
+            [None, False, None],
+            [{"number_of_shards": 1}, False, {"number_of_shards": 1}],
+            [None, True, {"refresh_interval": "-1", "number_of_replicas": 0}],
+            [
+                {"number_of_shards": 1, "refresh_interval": "30s"},
+                True,
+                {"number_of_shards": 1, "refresh_interval": "-1", "number_of_replicas": 0},
+            ],
+        ],
+    )
+    def test_normal_create_index_settings(self, index_settings, is_bulk_load_tuning, expected):
+        writer = make_writer(LocalClient(), [[1]])
+        writer.index_settings = index_settings
+        writer.is_bulk_load_tuning = is_bulk_load_tuning
+        writer.write_table()
+
+        _api, _index, body = writer.stream.call_list[0]
+        assert body.get("settings") == expected
+        assert "mappings" in body
+
+    def test_normal_created(self):
+        writer = make_writer(LocalClient(), [[i] for i in range(4)], index_name="tuning")
+        writer.index_settings = {"refresh_interval": "30s"}
+        writer.is_bulk_load_tuning = True
+        writer.force_merge_max_num_segments = 1
+        writer.bulk_chunk_size = 2
+        writer.write_table()
+
+        assert [call for call in writer.stream.call_list if call[0] != "create"] == [
+            ("bulk", "tuning", 2),
+            ("bulk", "tuning", 2),
+            (
+                "put_settings",
+                "tuning",
+                {"index": {"refresh_interval": "30s", "number_of_replicas": None}},
+            ),
+            ("refresh", "tuning", None),
+            ("forcemerge", "tuning", 1),
+        ]
+
+    def test_normal_existing(self):
+        writer = make_writer(
+            LocalClient(
+                settings={"refresh_interval": "5s", "number_of_replicas": "2"}, is_index_exists=True
+            ),
+            [[i] for i in range(4)],
+            index_name="tuning",
+        )
+        writer.is_bulk_load_tuning = True
+        writer.write_table()
+
+        assert [call for call in writer.stream.call_list if call[0] != "create"] == [
+            ("get_settings", "tuning", None),
+            (
+                "put_settings",
+                "tuning",
+                {"index": {"refresh_interval": "-1", "number_of_replicas": 0}},
+            ),
+            ("bulk", "tuning", 4),
+            (
+                "put_settings",
+                "tuning",
+                {"index": {"refresh_interval": "5s", "number_of_replicas": "2"}},
+            ),
+            ("refresh", "tuning", None),
+        ]
+
+    def test_normal_restore_on_error(self):
+        writer = make_writer(
+            LocalClient(error_doc_idx_list=[0]), [[i] for i in range(4)], index_name="tuning"
+        )
+        writer.is_bulk_load_tuning = True
+        writer.is_raise_on_bulk_error = True
+
+        with pytest.raises(ptw.BulkIndexError):
+            writer.write_table()
+
+        assert [call[0] for call in writer.stream.call_list] == [
+            "create",
+            "bulk",
+            "put_settings",
+            "refresh",
+        ]
+
+    def test_normal_without_tuning(self):
+        writer = make_writer(LocalClient(is_index_exists=True), [[i] for i in range(4)])
+        writer.write_table()
+
+        assert [call[0] for call in writer.stream.call_list] == ["create", "bulk"]
+
+
+class Test_ElasticsearchWriter_write_table_stream(object):
+    def test_normal_iterator(self):
+        client = LocalClient()
+
+        def value_matrix():
+            for i in range(10):
+                client.call_list.append(("row", None, i))
+                yield [i, "value {}".format(i)]
+
+        writer = make_writer(client, value_matrix(), headers=["i", "s"], index_name="stream")
+        writer.batch_size = 3
+        writer.bulk_chunk_size = 4
+        writer.is_bulk_load_tuning = True
+        writer.write_table()
+
+        # mappings determined from the first batch, and documents sent in chunks
+        # while reading the following rows (rows read ahead by a batch)
+        assert [call[0] if call[0] != "row" else call[2] for call in client.call_list] == [
+            0,
+            1,
+            2,
+            3,
+            4,
+            5,
+            "create",
+            6,
+            7,
+            8,
+            "bulk",
+            9,
+            "bulk",
+            "bulk",
+            "put_settings",
+            "refresh",
+        ]
+        assert client.call_list[6] == (
+            "create",
+            "stream",
+            {
+                "mappings": {
+                    "table": {"properties": {"i": {"type": "byte"}, "s": {"type": "text"}}}
+                },
+                "settings": {"refresh_interval": "-1", "number_of_replicas": 0},
+            },
+        )
+        assert [len(request["docs"]) for request in client.request_list] == [4, 4, 2]
+        assert client.doc_list == [{"i": i, "s": "value {}".format(i)} for i in range(10)]
+
+    def test_normal_write_table_iter(self):
+        writer = make_writer(
+            LocalClient(settings={"refresh_interval": "5s"}, is_index_exists=True),
+            [[[1], [2]], [[3]], [[4], [5]]],
+            index_name="stream",
+        )
+        writer.iteration_length = 3
+        writer.is_bulk_load_tuning = True
+        writer.force_merge_max_num_segments = 1
+        writer.write_table_iter()
+
+        # the index created/tuned only once, and settings restored after the last iteration
+        assert writer.stream.call_list == [
+            ("create", "stream", writer.stream.call_list[0][2]),
+            ("get_settings", "stream", None),
+            (
+                "put_settings",
+                "stream",
+                {"index": {"refresh_interval": "-1", "number_of_replicas": 0}},
+            ),
+            ("bulk", "stream", 2),
+            ("bulk", "stream", 1),
+            ("bulk", "stream", 2),
+            (
+                "put_settings",
+                "stream",
+                {"index": {"refresh_interval": "5s", "number_of_replicas": None}},
+            ),
+            ("refresh", "stream", None),
+            ("forcemerge", "stream", 1),
+        ]
+        assert writer.stream.doc_list == [{"i": i} for i in range(1, 6)]
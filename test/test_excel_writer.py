@@ -13,6 +13,7 @@ from decimal import Decimal
 import pytablewriter as ptw
 import pytest
 from pytablereader import ExcelTableFileLoader
+from pytablewriter.writer.binary._excel_workbook import ExcelWorkbookXlsx
 from tabledata import TableData
 
 from ._common import print_test_result
@@ -289,14 +290,213 @@ class Test_ExcelTableWriter_dump(object):
                 assert data == expected
 
 
-@pytest.mark.xfail(run=False)
 class Test_ExcelTableWriter_dumps(object):
-    def test_exception(self, tmpdir):
-        for writer_class in table_writer_class_list:
-            test_filepath = tmpdir.join("test.xlsx")
+    @pytest.mark.parametrize(
+        ["writer_class"], [[writer_class] for writer_class in table_writer_class_list]
+    )
+    def test_normal(self, tmpdir, writer_class):
+        if writer_class == ptw.ExcelXlsTableWriter and not HAS_XLWT:
+            pytest.skip()
 
-            writer = writer_class()
-            writer.open(str(test_filepath))
+        test_filepath = tmpdir.join("test.xlsx")
+        data = TableData("tablename", ["ha", "hb", "hc"], [[1, 2, "a"], [11, 12, "b"]])
+
+        writer = writer_class()
+        writer.from_tabledata(data)
+        output = writer.dumps()
+
+        assert isinstance(output, bytes)
+
+        test_filepath.write_binary(output)
+        for table_data in ExcelTableFileLoader(str(test_filepath)).load():
+            assert table_data == data
+
+    @pytest.mark.parametrize(
+        ["writer_class"], [[writer_class] for writer_class in table_writer_class_list]
+    )
+    def test_normal_dump_file_object(self, tmpdir, writer_class):
+        if writer_class == ptw.ExcelXlsTableWriter and not HAS_XLWT:
+            pytest.skip()
+
+        test_filepath = tmpdir.join("test.xlsx")
+        data_list = [
+            TableData("first", ["ha1", "hb1"], [[1, 2], [11, 12]]),
+            TableData("second", ["ha2", "hb2"], [[3, 4]]),
+        ]
+
+        writer = writer_class()
+        with open(str(test_filepath), "wb") as f:
+            for data in data_list:
+                writer.from_tabledata(data)
+                writer.dump(f, close_after_write=False)
+            writer.close()
+
+        for data, expected in zip(data_list, ExcelTableFileLoader(str(test_filepath)).load()):
+            assert data == expected
+
+
+class Test_ExcelXlsxTableWriter_constant_memory(object):
+    @pytest.mark.parametrize(["batch_size"], [[1], [2], [1024]])
+    def test_normal_generator(self, tmpdir, batch_size):
+        test_file_path = str(tmpdir.join("test.xlsx"))
+        rows = [[1, 1.1, "a"], [2, 2.2, "bb"], [3, 3.3, "ccc"]]
+
+        writer = ptw.ExcelXlsxTableWriter()
+        writer.workbook_options = {"constant_memory": True, "tmpdir": str(tmpdir)}
+        writer.table_name = "tablename"
+        writer.headers = ["ha", "hb", "hc"]
+        writer.value_matrix = (row for row in rows)
+        writer.batch_size = batch_size
+        writer.column_widths = [10, None, 20]
+        writer.dump(test_file_path)
+
+        assert writer.last_data_row == 4
+
+        for table_data in ExcelTableFileLoader(test_file_path).load():
+            assert table_data == TableData("tablename", ["ha", "hb", "hc"], rows)
+
+    def test_normal_write_table_iter(self, tmpdir):
+        test_file_path = str(tmpdir.join("test.xlsx"))
+
+        writer = ptw.ExcelXlsxTableWriter()
+        writer.workbook_options = {"constant_memory": True, "use_zip64": True}
+        writer.open(test_file_path)
+        writer.make_worksheet("tablename")
+        writer.headers = ["ha", "hb", "hc"]
+        writer.value_matrix = value_matrix_iter
+        writer.iteration_length = len(value_matrix_iter)
+        writer.column_widths = [10, 10, 10]
+        writer.write_table_iter()
+        writer.close()
+
+        for table_data in ExcelTableFileLoader(test_file_path).load():
+            assert table_data == TableData(
+                "tablename",
+                ["ha", "hb", "hc"],
+                [
+                    [1, 2, 3],
+                    [11, 12, 13],
+                    [1, 2, 3],
+                    [11, 12, 13],
+                    [101, 102, 103],
+                    [1001, 1002, 1003],
+                ],
+            )
+
+
+class Test_ExcelXlsxTableWriter_format_cache(object):
+    def test_normal_multi_sheet(self, tmpdir):
+        test_file_path = str(tmpdir.join("test.xlsx"))
+
+        writer = ptw.ExcelXlsxTableWriter()
+        writer.open(test_file_path)
+
+        writer.from_tabledata(TableData("first", ["ha", "hb", "hc"], [[1, 1.1, "a"]]))
+        writer.write_table()
+        num_format = len(writer.workbook.workbook.formats)
+
+        for table_name in ["second", "third"]:
+            writer.from_tabledata(TableData(table_name, ["ha", "hb", "hc"], [[2, 2.2, "b"]]))
+            writer.write_table()
+
+        assert len(writer.workbook.workbook.formats) == num_format
+
+        writer.close()
+
+    def test_normal_same_property(self, tmpdir):
+        workbook = ExcelWorkbookXlsx(str(tmpdir.join("test.xlsx")))
+
+        assert workbook.add_format({"bold": True, "font_size": 9}) is workbook.add_format(
+            {"font_size": 9, "bold": True}
+        )
+        assert workbook.add_format({"bold": True}) is not workbook.add_format({"bold": False})
+
+        workbook.close()
+
+
+class Test_ExcelXlsxTableWriter_set_conditional_style(object):
+    def test_normal(self, tmpdir):
+        from pytablewriter.style import Style
+
+        writer = ptw.ExcelXlsxTableWriter()
+        writer.open(str(tmpdir.join("test.xlsx")))
+        writer.from_tabledata(
+            TableData("cond", ["name", "value"], [["a", 1], ["b", -2], ["c", -3]])
+        )
+        writer.set_conditional_style(
+            "value",
+            lambda values: [0 if value < 0 else None for value in values],
+            [Style(font_weight="bold", align="center")],
+        )
+        writer.write_table()
+
+        cell_table = writer.stream.table
+        value_format_list = [cell_table[row][1].format for row in range(1, 4)]
+
+        assert [bool(cell_format.bold) for cell_format in value_format_list] == [False, True, True]
+        assert value_format_list[1] is value_format_list[2]
+        assert value_format_list[1].text_h_align != value_format_list[0].text_h_align
+        assert not cell_table[2][0].format.bold
+
+        writer.close()
+
+
+class Test_ExcelTableWriter_rollover(object):
+    @pytest.mark.parametrize(
+        ["writer_class"], [[writer_class] for writer_class in table_writer_class_list]
+    )
+    def test_normal_write_table(self, tmpdir, writer_class):
+        if writer_class == ptw.ExcelXlsTableWriter and not HAS_XLWT:
+            pytest.skip()
+
+        test_file_path = str(tmpdir.join("test.xlsx"))
+
+        writer = writer_class()
+        writer.MAX_ROW = 4
+        writer.table_name = "tablename"
+        writer.headers = ["ha", "hb"]
+        writer.value_matrix = [[i, "v{:d}".format(i)] for i in range(8)]
+        writer.dump(test_file_path)
+
+        assert [
+            (table_data.table_name, table_data.headers, len(table_data.rows))
+            for table_data in ExcelTableFileLoader(test_file_path).load()
+        ] == [
+            ("tablename", ["ha", "hb"], 3),
+            ("tablename_2", ["ha", "hb"], 3),
+            ("tablename_3", ["ha", "hb"], 2),
+        ]
+
+    @pytest.mark.parametrize(
+        ["writer_class"], [[writer_class] for writer_class in table_writer_class_list]
+    )
+    def test_normal_write_table_iter(self, tmpdir, writer_class):
+        if writer_class == ptw.ExcelXlsTableWriter and not HAS_XLWT:
+            pytest.skip()
+
+        test_file_path = str(tmpdir.join("test.xlsx"))
+
+        writer = writer_class()
+        writer.MAX_ROW = 5
+        writer.open(test_file_path)
+        writer.make_worksheet("a" * 31)
+        writer.headers = ["ha", "hb", "hc"]
+        writer.value_matrix = value_matrix_iter
+        writer.iteration_length = len(value_matrix_iter)
+        writer.write_table_iter()
+        writer.close()
 
-            with pytest.raises(NotImplementedError):
-                writer.dumps()
+        table_data_list = list(ExcelTableFileLoader(test_file_path).load())
+
+        assert [table_data.table_name for table_data in table_data_list] == [
+            "a" * 31,
+            "a" * 29 + "_2",
+        ]
+        assert [row for table_data in table_data_list for row in table_data.rows] == [
+            [1, 2, 3],
+            [11, 12, 13],
+            [1, 2, 3],
+            [11, 12, 13],
+            [101, 102, 103],
+            [1001, 1002, 1003],
+        ]
@@ -370,3 +370,25 @@ class Test_HtmlTableWriter_write_table_iter(object):
 
         with pytest.raises(pytablewriter.NotSupportedError):
             writer.write_table_iter()
+
+
+class Test_HtmlTableWriter_set_conditional_style(object):
+    def test_normal(self):
+        from pytablewriter.style import Style
+
+        writer = table_writer_class()
+        writer.headers = ["value"]
+        writer.value_matrix = [[1], [-2]]
+        writer.set_conditional_style(
+            0,
+            lambda values: [0 if value < 0 else None for value in values],
+            [Style(font_weight="bold")],
+        )
+
+        out = writer.dumps()
+        td_list = [line.strip() for line in out.splitlines() if "<td" in line]
+
+        assert td_list == [
+            '<td align="right">1</td>',
+            '<td align="right" style="font-weight:bold">-2</td>',
+        ]
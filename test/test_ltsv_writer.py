@@ -14,7 +14,7 @@ import pytablewriter as ptw
 import pytest
 
 from ._common import print_test_result
-from .data import float_header_list, float_value_matrix, headers, value_matrix
+from .data import float_header_list, float_value_matrix, headers, value_matrix, value_matrix_iter
 
 
 Data = collections.namedtuple("Data", "header value expected")
@@ -114,3 +114,50 @@ class Test_LtsvTableWriter_write_table(object):
 
         with pytest.raises(expected):
             writer.write_table()
+
+
+class Test_LtsvTableWriter_write_table_iter(object):
+    def test_normal(self, capsys):
+        writer = table_writer_class()
+        writer.headers = ["ha", "hb", "hc"]
+        writer.value_matrix = value_matrix_iter
+        writer.iteration_length = len(value_matrix_iter)
+        writer.write_table_iter()
+
+        out, _err = capsys.readouterr()
+        expected = dedent(
+            """\
+            ha:1\thb:2\thc:3
+            ha:11\thb:12\thc:13
+            ha:1\thb:2\thc:3
+            ha:11\thb:12\thc:13
+            ha:101\thb:102\thc:103
+            ha:1001\thb:1002\thc:1003
+            """
+        )
+        print_test_result(expected=expected, actual=out)
+
+        assert out == expected
+
+
+class Test_LtsvTableWriter_write_table_generator(object):
+    @pytest.mark.parametrize(["batch_size"], [[1], [2], [1024]])
+    def test_normal(self, capsys, batch_size):
+        writer = table_writer_class()
+        writer.headers = ["a b", "c"]
+        writer.value_matrix = ([i, None if i % 2 else "v{}".format(i)] for i in range(4))
+        writer.batch_size = batch_size
+        writer.write_table()
+
+        out, _err = capsys.readouterr()
+        expected = dedent(
+            """\
+            ab:0\tc:"v0"
+            ab:1
+            ab:2\tc:"v2"
+            ab:3
+            """
+        )
+        print_test_result(expected=expected, actual=out)
+
+        assert out == expected
@@ -13,7 +13,9 @@ from textwrap import dedent
 import pytablewriter as ptw
 import pytest
 import six  # noqa: W0611
+from dataproperty import DataProperty, DataPropertyExtractor
 from pytablewriter.style import Align, FontSize, Style, ThousandSeparator
+from pytablewriter.writer._table_writer import _RowItemMemo
 from tabledata import TableData
 from termcolor import colored
 
@@ -1133,3 +1135,225 @@ class Test_MarkdownTableWriter_from_dataframe(object):
         print_test_result(expected=expected, actual=out)
 
         assert out == expected
+
+
+class Test_MarkdownTableWriter_row_item_memo(object):
+    class CountingWriter(ptw.MarkdownTableWriter):
+        def __init__(self):
+            super(Test_MarkdownTableWriter_row_item_memo.CountingWriter, self).__init__()
+            self.to_row_item_count = 0
+
+        def _to_row_item(self, col_dp, value_dp, styler=None):
+            self.to_row_item_count += 1
+            return super(Test_MarkdownTableWriter_row_item_memo.CountingWriter, self)._to_row_item(
+                col_dp, value_dp, styler
+            )
+
+    def test_normal_low_cardinality(self):
+        status_list = ["ok", "warning", "ng", None]
+        writer = self.CountingWriter()
+        writer.headers = ["status", "level"]
+        writer.value_matrix = [[status_list[i % 4], i % 3] for i in range(300)]
+        writer.styles = [Style(font_weight="bold")]
+
+        out = writer.dumps()
+        expected_row_list = [
+            "|**ok**     |    0|",
+            "|**warning**|    1|",
+            "|**ng**     |    2|",
+            "|           |    0|",
+        ]
+
+        assert writer.to_row_item_count == len(status_list) + 3
+        assert out.splitlines()[2:6] == expected_row_list
+        assert out.splitlines()[2:] == [
+            "|{}|{:>5d}|".format(expected_row_list[i % 4][1:12], i % 3) for i in range(300)
+        ]
+
+    def test_normal_high_cardinality(self):
+        writer = self.CountingWriter()
+        writer.headers = ["id", "value"]
+        writer.value_matrix = [["id{:d}".format(i), 1] for i in range(300)]
+
+        out = writer.dumps()
+
+        assert writer.to_row_item_count == 300 + 1
+        assert out.splitlines()[2:] == ["|id{:<3d}|    1|".format(i) for i in range(300)]
+
+    def test_normal_cardinality_increase(self):
+        to_row_item_list = []
+
+        def to_row_item(col_dp, value_dp):
+            to_row_item_list.append(value_dp.data)
+            return value_dp.to_str()
+
+        memo = _RowItemMemo(to_row_item, DataProperty("id"))
+        low_cardinality_list = ["id{:d}".format(i % 4) for i in range(_RowItemMemo.MAX_SIZE * 4)]
+        high_cardinality_list = [
+            "id{:d}".format(i) for i in range(4, _RowItemMemo.MAX_SIZE + _RowItemMemo.SAMPLE_SIZE)
+        ]
+
+        assert [memo.to_row_item(DataProperty(value)) for value in low_cardinality_list] == (
+            low_cardinality_list
+        )
+        assert memo.is_enabled
+        assert len(to_row_item_list) == 4
+
+        assert [memo.to_row_item(DataProperty(value)) for value in high_cardinality_list] == (
+            high_cardinality_list
+        )
+        assert not memo.is_enabled
+        assert to_row_item_list[4:] == high_cardinality_list
+
+
+class Test_MarkdownTableWriter_set_conditional_style(object):
+    def test_normal(self):
+        call_list = []
+
+        def style_func(values):
+            call_list.append(values)
+            return [0 if value < 0 else (1 if value > 100 else None) for value in values]
+
+        writer = table_writer_class()
+        writer.headers = ["name", "value"]
+        writer.value_matrix = [["a", 1], ["b", -2], ["c", 300], ["d", -4]]
+        writer.set_conditional_style(
+            "value", style_func, [Style(font_weight="bold"), Style(font_style="italic")]
+        )
+
+        out = writer.dumps()
+        expected = dedent(
+            """\
+            |name| value |
+            |----|------:|
+            |a   |      1|
+            |b   | **-2**|
+            |c   |  _300_|
+            |d   | **-4**|
+            """
+        )
+        print_test_result(expected=expected, actual=out)
+
+        assert out == expected
+        assert call_list == [[1, -2, 300, -4]]
+
+    def test_normal_column_style(self):
+        writer = table_writer_class()
+        writer.headers = ["name", "value"]
+        writer.value_matrix = [["a", 1], ["b", 2]]
+        writer.set_style(0, Style(font_style="italic"))
+        writer.set_conditional_style(0, lambda values: [-1, 0], [Style(font_weight="bold")])
+
+        assert writer.dumps().splitlines()[2:] == ["|_a_    |    1|", "|**b**  |    2|"]
+
+        writer.set_conditional_style(0, None, [])
+
+        assert writer.dumps().splitlines()[2:] == ["|_a_  |    1|", "|_b_  |    2|"]
+
+    def test_normal_exception_while_formatting(self, monkeypatch):
+        writer = table_writer_class()
+        writer.headers = ["name", "value"]
+        writer.value_matrix = [["a", 1], ["b", -2], ["c", 300]]
+        writer.set_conditional_style(
+            "value",
+            lambda values: [0 if value < 0 else None for value in values],
+            [Style(font_weight="bold")],
+        )
+        expected = writer.dumps()
+
+        to_row_item = ptw.MarkdownTableWriter._to_row_item
+
+        def failing_to_row_item(self, col_dp, value_dp, styler=None):
+            if styler is not None:
+                raise RuntimeError("formatting failed")
+
+            return to_row_item(self, col_dp, value_dp, styler)
+
+        writer.set_conditional_style(
+            "value",
+            lambda values: [0 if value > 100 else None for value in values],
+            [Style(font_weight="bold")],
+        )
+        monkeypatch.setattr(ptw.MarkdownTableWriter, "_to_row_item", failing_to_row_item)
+        with pytest.raises(RuntimeError):
+            writer.dumps()
+        monkeypatch.undo()
+
+        # stylers of columns are not replaced by the conditional stylers
+        assert [styler.style for styler in writer._styler_list] == [Style(), Style()]
+
+        writer.set_conditional_style(
+            "value",
+            lambda values: [0 if value < 0 else None for value in values],
+            [Style(font_weight="bold")],
+        )
+        out = writer.dumps()
+        print_test_result(expected=expected, actual=out)
+
+        assert out == expected
+
+    @pytest.mark.parametrize(
+        ["column", "style_func", "expected"],
+        [
+            ["not_exist", lambda values: [None] * len(values), ValueError],
+            [1.5, lambda values: [None] * len(values), ValueError],
+            [0, lambda values: [None], ValueError],
+            [0, lambda values: [1] * len(values), ValueError],
+        ],
+    )
+    def test_exception(self, column, style_func, expected):
+        writer = table_writer_class()
+        writer.headers = ["name", "value"]
+        writer.value_matrix = [["a", 1], ["b", 2]]
+
+        with pytest.raises(expected):
+            writer.set_conditional_style(column, style_func, [Style(font_weight="bold")])
+            writer.dumps()
+
+
+class Test_MarkdownTableWriter_styles_preprocess(object):
+    @staticmethod
+    def __dumps(styles):
+        writer = table_writer_class()
+        writer.headers = ["i", "s"]
+        writer.value_matrix = [[1000, "a"], [2, "bb"]]
+        writer.styles = styles
+
+        return writer.dumps()
+
+    def test_normal(self, monkeypatch):
+        writer = table_writer_class()
+        writer.headers = ["i", "s"]
+        writer.value_matrix = [[1000, "a"], [2, "bb"]]
+        writer.dumps()
+
+        call_list = []
+        to_dp_matrix = DataPropertyExtractor.to_dp_matrix
+
+        def count_to_dp_matrix(extractor, value_matrix):
+            if extractor is writer._dp_extractor:
+                call_list.append(value_matrix)
+
+            return to_dp_matrix(extractor, value_matrix)
+
+        monkeypatch.setattr(DataPropertyExtractor, "to_dp_matrix", count_to_dp_matrix)
+
+        # styles that do not change thousand separators reuse the extracted data
+        for styles in (
+            [Style(font_weight="bold"), None],
+            [Style(font_weight="bold"), Style(font_style="italic")],
+            [Style(align="center"), Style(font_style="italic")],
+        ):
+            writer.styles = styles
+            assert writer.dumps() == self.__dumps(styles)
+
+        writer.set_style(1, Style(font_style="italic"))
+        writer.set_style("s", Style(font_weight="bold"))
+        assert writer.dumps() == self.__dumps([Style(align="center"), Style(font_weight="bold")])
+        assert call_list == []
+
+        writer.set_style(0, Style(thousand_separator=","))
+        assert writer.dumps() == self.__dumps(
+            [Style(thousand_separator=","), Style(font_weight="bold")]
+        )
+        assert len(call_list) == 1
@@ -6,6 +6,9 @@
 
 from __future__ import absolute_import, print_function, unicode_literals
 
+import sys
+from datetime import datetime
+
 import pytablewriter as ptw
 import pytest
 
@@ -174,6 +177,176 @@ class Test_NumpyTableWriter_write_table(object):
             writer.write_table()
 
 
+@pytest.mark.skipif("SKIP_DATAFRAME_TEST is True")
+class Test_NumpyTableWriter_dump_binary(object):
+    def test_normal_npy(self, tmpdir):
+        p = tmpdir.join("tmp.npy")
+        writer = table_writer_class()
+        writer.headers = ["i", "f", "n", "b"]
+        writer.value_matrix = [[1, 1.1, None, True], [2, "2.2", 3, False]]
+        writer.dump_binary(str(p))
+
+        out = np.load(str(p))
+
+        assert out.shape == (2, 4)
+        assert out.dtype == np.float64
+        assert out[1].tolist()[:2] == [2, 2.2]
+        assert np.isnan(out[0][2])
+
+    def test_normal_npz(self, tmpdir):
+        p = tmpdir.join("tmp.npz")
+        writer = table_writer_class()
+        writer.headers = ["i", "f", "s", "dt", "file"]
+        writer.value_matrix = [
+            [1, 1.1, "a", datetime(2017, 1, 1, 0, 0, 0), True],
+            [2, 2.2, None, None, False],
+        ]
+        writer.dump_binary(str(p))
+
+        out = np.load(str(p))
+
+        assert out.files == ["i", "f", "s", "dt", "file"]
+        assert out["i"].dtype == np.int64
+        assert out["i"].tolist() == [1, 2]
+        assert out["f"].tolist() == [1.1, 2.2]
+        assert out["s"].tolist() == ["a", ""]
+        assert out["dt"].dtype == np.dtype("datetime64[us]")
+        assert np.isnat(out["dt"][1])
+        assert out["file"].dtype == np.bool_
+
+    def test_normal_large_integer(self, tmpdir):
+        p = tmpdir.join("tmp.npz")
+        writer = table_writer_class()
+        writer.headers = ["large", "nullable", "small"]
+        writer.value_matrix = [[2 ** 70, 2 ** 60, 1], [-1, None, None]]
+        writer.dump_binary(str(p))
+
+        out = np.load(str(p), allow_pickle=True)
+
+        assert out["large"].dtype == object
+        assert out["large"].tolist() == [2 ** 70, -1]
+        assert out["nullable"].dtype == object
+        assert out["nullable"].tolist() == [2 ** 60, None]
+        assert out["small"].dtype == np.float64
+        assert np.isnan(out["small"][1])
+
+    def test_normal_extract_once(self, tmpdir):
+        writer = table_writer_class()
+        writer.table_name = "tablename"
+        writer.headers = ["i", "s"]
+        writer.value_matrix = [[1, "a"], [2, "b"]]
+        expected = writer.dumps()
+
+        call_list = []
+        to_dp_matrix = writer._dp_extractor.to_dp_matrix
+
+        def count_to_dp_matrix(value_matrix):
+            call_list.append(value_matrix)
+            return to_dp_matrix(value_matrix)
+
+        writer._dp_extractor.to_dp_matrix = count_to_dp_matrix
+        writer.dump_binary(str(tmpdir.join("tmp1.npz")))
+        writer.dump_binary(str(tmpdir.join("tmp2.npz")))
+
+        assert len(call_list) == 1
+
+        # source code output is not affected by the binary output
+        assert writer.dumps() == expected
+
+    def test_normal_line_break(self, tmpdir):
+        p = tmpdir.join("tmp.npz")
+        writer = table_writer_class()
+        writer.headers = ["s"]
+        writer.value_matrix = [["a\nb"], ["c\r\nd"]]
+        writer.dump_binary(str(p))
+
+        assert np.load(str(p))["s"].tolist() == ["a\nb", "c\r\nd"]
+        assert writer.line_break_handling == ptw.LineBreakHandling.REPLACE
+
+        writer.line_break_handling = ptw.LineBreakHandling.ESCAPE
+        writer.dump_binary(str(p))
+
+        assert np.load(str(p))["s"].tolist() == ["a\nb", "c\r\nd"]
+        assert writer.line_break_handling == ptw.LineBreakHandling.ESCAPE
+
+    def test_exception_non_numeric_npy(self, tmpdir):
+        writer = table_writer_class()
+        writer.headers = ["i", "s"]
+        writer.value_matrix = [[1, "a"]]
+
+        with pytest.raises(ValueError):
+            writer.dump_binary(str(tmpdir.join("tmp.npy")))
+
+    def test_exception_format(self, tmpdir):
+        writer = table_writer_class()
+        writer.headers = ["i"]
+        writer.value_matrix = [[1]]
+
+        with pytest.raises(ValueError):
+            writer.dump_binary(str(tmpdir.join("tmp.npy")), file_format="csv")
+
+    def test_exception_numpy_not_installed(self, tmpdir, monkeypatch):
+        writer = table_writer_class()
+        writer.headers = ["i"]
+        writer.value_matrix = [[1]]
+        monkeypatch.setitem(sys.modules, "numpy", None)
+
+        with pytest.raises(ImportError) as e:
+            writer.dump_binary(str(tmpdir.join("tmp.npy")))
+
+        assert "pip install pytablewriter[numpy]" in str(e.value)
+
+
+@pytest.mark.skipif("SKIP_DATAFRAME_TEST is True")
+class Test_NumpyTableWriter_binary_file_path(object):
+    @pytest.mark.parametrize(
+        ["filename", "mmap_mode", "expected"],
+        [
+            ["tmp.npy", None, 'tablename = np.load("{}")\n'],
+            ["tmp.npy", "r", 'tablename = np.load("{}", mmap_mode="r")\n'],
+            ["tmp.npz", "r", 'tablename = np.load("{}")\n'],
+        ],
+    )
+    def test_normal(self, tmpdir, filename, mmap_mode, expected):
+        p = str(tmpdir.join(filename))
+        writer = table_writer_class()
+        writer.table_name = "tablename"
+        writer.headers = ["a", "b"]
+        writer.value_matrix = [[1, 2.5], [3, 4.5]]
+        writer.binary_file_path = p
+        writer.mmap_mode = mmap_mode
+        writer.is_write_null_line_after_table = False
+
+        out = writer.dumps()
+        print_test_result(expected=expected.format(p), actual=out)
+
+        assert out == expected.format(p)
+        assert tmpdir.join(filename).check()
+
+    def test_normal_object_array(self, tmpdir):
+        p = str(tmpdir.join("tmp.npy"))
+        writer = table_writer_class()
+        writer.table_name = "tablename"
+        writer.headers = ["a"]
+        writer.value_matrix = [[2 ** 70], [1]]
+        writer.binary_file_path = p
+        writer.is_write_null_line_after_table = False
+
+        assert writer.dumps() == 'tablename = np.load("{}", allow_pickle=True)\n'.format(p)
+        assert np.load(p, allow_pickle=True).tolist() == [[2 ** 70], [1]]
+
+    def test_exception_iter(self, tmpdir):
+        writer = table_writer_class()
+        writer.table_name = "tablename"
+        writer.headers = ["a"]
+        writer.value_matrix = [[1]]
+        writer.iteration_length = 1
+        writer.binary_file_path = str(tmpdir.join("tmp.npy"))
+
+        with pytest.raises(ptw.NotSupportedError):
+            writer.write_table_iter()
+
+
 class Test_NumpyTableWriter_write_table_iter(object):
     @pytest.mark.parametrize(
         ["table", "header", "value", "expected"],
@@ -6,6 +6,8 @@
 
 from __future__ import absolute_import, print_function, unicode_literals
 
+from datetime import datetime
+from decimal import Decimal
 from textwrap import dedent
 
 import pytablewriter
@@ -325,3 +327,141 @@ class Test_PandasDataFrameWriter_from_dataframe(object):
         print_test_result(expected=expected, actual=out)
 
         assert out == expected
+
+
+@pytest.mark.skipif("SKIP_DATAFRAME_TEST is True")
+class Test_PandasDataFrameWriter_binary_file_path(object):
+    @pytest.mark.parametrize(
+        ["filename", "expected"],
+        [
+            ["tmp.npy", 'tablename = pd.DataFrame(np.load("{}"), columns=["a", "b"])\n'],
+            ["tmp.npz", 'tablename = pd.DataFrame(dict(np.load("{}")), columns=["a", "b"])\n'],
+        ],
+    )
+    def test_normal(self, tmpdir, filename, expected):
+        p = str(tmpdir.join(filename))
+        writer = table_writer_class()
+        writer.table_name = "tablename"
+        writer.headers = ["a", "b"]
+        writer.value_matrix = [[1, 2.5], [3, 4.5]]
+        writer.binary_file_path = p
+        writer.is_write_null_line_after_table = False
+
+        out = writer.dumps()
+        print_test_result(expected=expected.format(p), actual=out)
+
+        assert out == expected.format(p)
+
+        local_vars = {"np": np, "pd": pd}
+        exec(out, {}, local_vars)
+        df = local_vars["tablename"]
+
+        assert df.columns.tolist() == ["a", "b"]
+        assert df["b"].tolist() == [2.5, 4.5]
+
+
+class Test_PandasDataFrameWriter_columnar_output(object):
+    def test_normal(self):
+        writer = table_writer_class()
+        writer.table_name = "tablename"
+        writer.headers = ["i", "i_null", "f", "b", "b_null", "s", "dt", "none"]
+        writer.value_matrix = [
+            [1, 1, 1.5, True, True, "a", datetime(2017, 1, 1, 0, 0, 0), None],
+            [2, None, float("inf"), False, None, None, None, None],
+        ]
+        writer.is_columnar_output = True
+        writer.is_write_null_line_after_table = False
+
+        expected = dedent(
+            """\
+            tablename = pd.DataFrame({
+                "i": np.array([1, 2], dtype="int64"),
+                "i_null": pd.array([1, None], dtype="Int64"),
+                "f": np.array([1.5, np.inf], dtype="float64"),
+                "b": np.array([True, False], dtype="bool"),
+                "b_null": pd.array([True, None], dtype="boolean"),
+                "s": np.array(["a", None], dtype=object),
+                "dt": np.array(["2017-01-01T00:00:00", "NaT"], dtype="datetime64[us]"),
+                "none": np.array([None, None], dtype=object),
+            })
+            """
+        )
+        out = writer.dumps()
+        print_test_result(expected=expected, actual=out)
+
+        assert out == expected
+
+    @pytest.mark.skipif("SKIP_DATAFRAME_TEST is True")
+    def test_normal_dtypes(self):
+        writer = table_writer_class()
+        writer.table_name = "tablename"
+        writer.headers = ["i", "i_null", "f", "dt"]
+        writer.value_matrix = (
+            row for row in [[1, 1, 0.5, datetime(2017, 1, 1)], [2, None, None, None]]
+        )
+        writer.is_columnar_output = True
+
+        local_vars = {"np": np, "pd": pd}
+        exec(writer.dumps(), {}, local_vars)
+        df = local_vars["tablename"]
+
+        assert df["i"].dtype == np.int64
+        assert str(df["i_null"].dtype) == "Int64"
+        assert df["f"].dtype == np.float64
+        assert df["dt"].dtype.kind == "M"
+        assert df["dt"].isnull().tolist() == [False, True]
+
+    @pytest.mark.skipif("SKIP_DATAFRAME_TEST is True")
+    def test_normal_mixed_values(self):
+        writer = table_writer_class()
+        writer.table_name = "tablename"
+        writer.headers = ["ifc", "mix"]
+        writer.value_matrix = [
+            [1, Decimal("1.5")],
+            [2.2, float("nan")],
+            ["ccc", float("inf")],
+            [None, "x"],
+        ]
+
+        writer.is_columnar_output = True
+        out = writer.dumps()
+        assert '"ifc": np.array([1, 2.2, "ccc", None], dtype=object),' in out
+
+        local_vars = {"np": np, "pd": pd}
+        exec(out, {}, local_vars)
+        columnar_df = local_vars["tablename"]
+
+        writer.is_columnar_output = False
+        local_vars = {"np": np, "pd": pd}
+        exec(writer.dumps(), {}, local_vars)
+        row_df = local_vars["tablename"]
+
+        assert columnar_df["ifc"].tolist() == [1, 2.2, "ccc", None]
+        assert columnar_df.equals(row_df)
+
+    @pytest.mark.skipif("SKIP_DATAFRAME_TEST is True")
+    def test_normal_control_chars(self):
+        value_list = ['a"b\\c', "\x00\x1b[31m\x7f", "\b\f\n\r", "\u3042"]
+        writer = table_writer_class()
+        writer.table_name = "tablename"
+        writer.headers = ["s\x00"]
+        writer.value_matrix = [[value] for value in value_list]
+        writer.is_columnar_output = True
+
+        local_vars = {"np": np, "pd": pd}
+        exec(writer.dumps(), {}, local_vars)
+        df = local_vars["tablename"]
+
+        assert df.columns.tolist() == ["s\x00"]
+        assert df["s\x00"].tolist() == value_list
+
+    def test_exception_iter(self):
+        writer = table_writer_class()
+        writer.table_name = "tablename"
+        writer.headers = ["a"]
+        writer.value_matrix = [[1]]
+        writer.iteration_length = 1
+        writer.is_columnar_output = True
+
+        with pytest.raises(pytablewriter.NotSupportedError):
+            writer.write_table_iter()
@@ -0,0 +1,40 @@
+# encoding: utf-8
+
+from __future__ import absolute_import, print_function, unicode_literals
+
+import pytablewriter as ptw
+import pytest
+
+from ._common import print_test_result
+
+
+class Test_SourceCodeTableWriter_write_table_generator(object):
+    @pytest.mark.parametrize(
+        ["writer_class", "batch_size"],
+        [
+            [writer_class, batch_size]
+            for writer_class in [
+                ptw.JavaScriptTableWriter,
+                ptw.NumpyTableWriter,
+                ptw.PandasDataFrameWriter,
+                ptw.PythonCodeTableWriter,
+            ]
+            for batch_size in [1, 2, 1024]
+        ],
+    )
+    def test_normal(self, writer_class, batch_size):
+        rows = [[1, "a", True], [2.5, None, False], [3, "ccc", None]]
+
+        writer = writer_class()
+        writer.table_name = "generator"
+        writer.headers = ["i", "s", "b"]
+        writer.value_matrix = rows
+        expected = writer.dumps()
+
+        writer.value_matrix = (row for row in rows)
+        writer.batch_size = batch_size
+        out = writer.dumps()
+
+        print_test_result(expected=expected, actual=out)
+
+        assert out == expected
@@ -2,6 +2,8 @@
 
 from __future__ import print_function, unicode_literals
 
+import copy
+import pickle
 import sys
 
 import pytest
@@ -135,6 +137,42 @@ class Test_Style_eq(object):
             Style(align=align, font_size=font_size, thousand_separator=thousand_separator)
 
 
+class Test_Style_hash(object):
+    @pytest.mark.parametrize(
+        ["lhs", "rhs", "expected"],
+        [
+            [{}, {}, True],
+            [{"align": Align.RIGHT}, {"align": "right"}, True],
+            [{"thousand_separator": ","}, {"thousand_separator": "comma"}, True],
+            [{"align": Align.RIGHT}, {"align": Align.LEFT}, False],
+            [{"font_weight": "bold"}, {"font_style": "italic"}, False],
+        ],
+    )
+    def test_normal(self, lhs, rhs, expected):
+        lhs_style = Style(**lhs)
+        rhs_style = Style(**rhs)
+
+        assert (lhs_style is rhs_style) == expected
+        assert (hash(lhs_style) == hash(rhs_style)) == expected
+        assert len({lhs_style, rhs_style}) == (1 if expected else 2)
+
+    def test_normal_copy(self):
+        style = Style(align="left", font_size="tiny", thousand_separator=" ")
+
+        assert copy.copy(style) is style
+        assert copy.deepcopy(style) is style
+        assert pickle.loads(pickle.dumps(style)) is style
+
+    @pytest.mark.parametrize(["attr_name"], [["align"], ["font_size"], ["unknown"]])
+    def test_exception(self, attr_name):
+        style = Style()
+
+        with pytest.raises(AttributeError):
+            setattr(style, attr_name, Align.RIGHT)
+
+        assert style.align is Align.AUTO
+
+
 class Test_Style_repr(object):
     @pytest.mark.parametrize(
         ["value", "expected"],
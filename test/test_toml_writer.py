@@ -16,7 +16,7 @@ import toml
 from dateutil.parser import parse
 
 from ._common import print_test_result
-from .data import float_header_list, float_value_matrix, headers, value_matrix
+from .data import float_header_list, float_value_matrix, headers, value_matrix, value_matrix_iter
 
 
 Data = collections.namedtuple("Data", "table_name header value expected")
@@ -151,7 +151,6 @@ class Test_TomlTableWriter_write_new_line(object):
 
 
 class Test_TomlTableWriter_write_table(object):
-    @pytest.mark.xfail(run=False)
     @pytest.mark.parametrize(
         ["table_name", "header", "value", "expected"],
         [
@@ -186,3 +185,57 @@ class Test_TomlTableWriter_write_table(object):
 
         with pytest.raises(expected):
             writer.write_table()
+
+
+class Test_TomlTableWriter_keys(object):
+    def test_normal_trailing_line_break(self, capsys):
+        writer = table_writer_class()
+        writer.table_name = "table"
+        writer.headers = ["a\n", "b"]
+        writer.value_matrix = [[1, 2]]
+        writer.write_table()
+
+        out, err = capsys.readouterr()
+        print_test_result(expected="", actual=out, error=err)
+
+        assert out == '[[table]]\n"a\\n" = 1\nb = 2\n\n'
+        assert toml.loads(out) == {"table": [{"a\n": 1, "b": 2}]}
+
+
+class Test_TomlTableWriter_write_table_iter(object):
+    def test_normal(self, capsys):
+        writer = table_writer_class()
+        writer.table_name = "iter"
+        writer.headers = ["ha", "hb", "hc"]
+        writer.value_matrix = value_matrix_iter
+        writer.iteration_length = len(value_matrix_iter)
+        writer.write_table_iter()
+
+        out, err = capsys.readouterr()
+        print_test_result(expected="", actual=out, error=err)
+
+        assert toml.loads(out) == {
+            "iter": [
+                {"ha": value_list[0], "hb": value_list[1], "hc": value_list[2]}
+                for work_matrix in value_matrix_iter
+                for value_list in work_matrix
+            ]
+        }
+
+
+class Test_TomlTableWriter_write_table_generator(object):
+    @pytest.mark.parametrize(["batch_size"], [[1], [3], [1024]])
+    def test_normal(self, capsys, batch_size):
+        writer = table_writer_class()
+        writer.table_name = "generator"
+        writer.headers = ["i", "f", "s"]
+        writer.value_matrix = ([i, i + 0.5, "v{}".format(i)] for i in range(5))
+        writer.batch_size = batch_size
+        writer.write_table()
+
+        out, err = capsys.readouterr()
+        print_test_result(expected="", actual=out, error=err)
+
+        assert toml.loads(out) == {
+            "generator": [{"i": i, "f": i + 0.5, "s": "v{}".format(i)} for i in range(5)]
+        }
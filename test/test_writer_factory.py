@@ -241,3 +241,67 @@ class Test_FileLoaderFactory_create_from_format_name(object):
     def test_exception(self, format_name, expected):
         with pytest.raises(expected):
             ptw.TableWriterFactory.create_from_format_name(format_name)
+
+
+class Test_WriterFactory_register_writer(object):
+    @pytest.fixture
+    def registry(self, monkeypatch):
+        from pytablewriter import _factory
+
+        registry = _factory._WriterRegistry()
+        monkeypatch.setattr(_factory, "_writer_registry", registry)
+
+        return registry
+
+    def test_normal(self, registry):
+        class MyTableWriter(ptw.CsvTableWriter):
+            FORMAT_NAME = "my_format"
+
+        ptw.TableWriterFactory.register_writer(MyTableWriter, file_extensions=[".MYF", "myf2"])
+
+        assert isinstance(
+            ptw.TableWriterFactory.create_from_format_name("My_Format"), MyTableWriter
+        )
+        assert isinstance(
+            ptw.TableWriterFactory.create_from_file_extension("output.myf"), MyTableWriter
+        )
+        assert isinstance(ptw.TableWriterFactory.create_from_file_extension("myf2"), MyTableWriter)
+        assert "my_format" in ptw.TableWriterFactory.get_format_name_list()
+        assert {"myf", "myf2"} <= set(ptw.TableWriterFactory.get_extension_list())
+        assert ptw.TableWriterFactory.get_format_name_list() == sorted(
+            ptw.TableWriterFactory.get_format_name_list()
+        )
+
+    def test_normal_format_names(self, registry):
+        ptw.TableWriterFactory.register_writer(ptw.TsvTableWriter, format_names=["TSV2", "tab"])
+
+        assert isinstance(
+            ptw.TableWriterFactory.create_from_format_name("tsv2"), ptw.TsvTableWriter
+        )
+        assert isinstance(ptw.TableWriterFactory.create_from_format_name("tab"), ptw.TsvTableWriter)
+
+    def test_normal_not_affect_list(self, registry):
+        name_list = ptw.TableWriterFactory.get_format_name_list()
+        name_list.append("dummy")
+
+        assert "dummy" not in ptw.TableWriterFactory.get_format_name_list()
+
+    @pytest.mark.parametrize(
+        ["writer_class", "format_names", "file_extensions", "expected"],
+        [
+            [ptw.CsvTableWriter, None, None, ValueError],
+            [ptw.CsvTableWriter, ["md"], None, ValueError],
+            [ptw.CsvTableWriter, ["excel"], None, ValueError],
+            [ptw.CsvTableWriter, ["csv2"], [".tex"], ValueError],
+            [ptw.CsvTableWriter, [], [], ValueError],
+            [ptw.CsvTableWriter, [""], None, ValueError],
+            [ptw.CsvTableWriter, ["csv2"], ["."], ValueError],
+            [None, ["csv2"], None, TypeError],
+        ],
+    )
+    def test_exception(self, registry, writer_class, format_names, file_extensions, expected):
+        with pytest.raises(expected):
+            ptw.TableWriterFactory.register_writer(writer_class, format_names, file_extensions)
+
+        with pytest.raises(ptw.WriterNotFoundError):
+            ptw.TableWriterFactory.create_from_format_name("csv2")